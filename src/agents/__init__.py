@@ -3,14 +3,21 @@ Agents Module
 
 Multi-agent system for AIOps using AWS Strands Agents SDK.
 Each agent can be used standalone or as part of the orchestrated swarm.
+
+Agent classes are imported lazily on first attribute access, so importing
+one agent does not pull in the others.
 """
 
-from .base import BaseAgent
-from .coding_agent import CodingAgent
-from .datadog_agent import DataDogAgent
-from .orchestrator import OrchestratorAgent
-from .s3_agent import S3Agent
-from .servicenow_agent import ServiceNowAgent
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .base import BaseAgent
+    from .coding_agent import CodingAgent
+    from .datadog_agent import DataDogAgent
+    from .orchestrator import OrchestratorAgent
+    from .s3_agent import S3Agent
+    from .servicenow_agent import ServiceNowAgent
 
 __all__ = [
     "BaseAgent",
@@ -20,3 +27,25 @@ __all__ = [
     "S3Agent",
     "OrchestratorAgent",
 ]
+
+# Public name -> submodule that defines it
+_LAZY = {
+    "BaseAgent": ".base",
+    "DataDogAgent": ".datadog_agent",
+    "CodingAgent": ".coding_agent",
+    "ServiceNowAgent": ".servicenow_agent",
+    "S3Agent": ".s3_agent",
+    "OrchestratorAgent": ".orchestrator",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
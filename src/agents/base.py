@@ -5,29 +5,194 @@ Provides the BaseAgent class that all specialized agents inherit from.
 Contains shared functionality for initialization, logging, and action tracking.
 """
 
+import functools
+import os
+import threading
 import time
-import uuid
 from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Callable
+from dataclasses import MISSING, dataclass, field, fields, replace
 from datetime import UTC, datetime
 from typing import Any
 
-from pydantic import BaseModel, Field
+from botocore.config import Config
 from strands import Agent
 from strands.models.bedrock import BedrockModel
 
 from ..utils.config_loader import AgentConfig, get_agent_config, load_settings
 from ..utils.logging_config import get_logger
 
+_module_logger = get_logger("agents.base")
+
+# Process-global caches shared by every agent in the process. Building a
+# BedrockModel resolves the credential chain and creates a bedrock-runtime
+# client, so agents with the same (model_id, region) share one instance.
+_MODEL_CACHE_ENABLED = os.environ.get("ENABLE_MODEL_CACHE", "true").lower() == "true"
+_model_cache: dict[tuple[str, str], BedrockModel] = {}
+_model_cache_stats = {"hits": 0, "misses": 0}
+_tools_cache: dict[type, list] = {}
+_cache_lock = threading.Lock()
+# (model_id, region) -> lock held while that model is being built, so a cold
+# build only blocks callers that want the same model
+_model_build_locks: dict[tuple[str, str], threading.Lock] = {}
+
+# bedrock-runtime client settings: the orchestrator's parallel stages share
+# one model, so its connection pool must cover the fan-out
+_BEDROCK_CLIENT_CONFIG = Config(
+    max_pool_connections=64,
+    retries={"mode": "adaptive", "total_max_attempts": 5},
+)
+
+# Long-lived agents keep only the most recent actions; the invocation
+# counters on AgentState still count every recorded action.
+_ACTION_HISTORY_MAX = int(os.environ.get("AGENT_ACTION_HISTORY_MAX", "1000"))
+
+# Indexed by AgentAction.success (False -> 0, True -> 1)
+_STATUS_MARKS = ("✗", "✓")
+
+
+def _build_model(model_id: str, region: str) -> BedrockModel:
+    """Build a BedrockModel with the shared bedrock-runtime client settings."""
+    return BedrockModel(
+        model_id=model_id,
+        region_name=region,
+        boto_client_config=_BEDROCK_CLIENT_CONFIG,
+    )
+
+
+def _get_or_create_model(model_id: str, region: str) -> BedrockModel:
+    """Get the shared BedrockModel for (model_id, region), creating it on first use."""
+    if not _MODEL_CACHE_ENABLED:
+        return _build_model(model_id, region)
+
+    key = (model_id, region)
+    outcome = "hit"
+    with _cache_lock:
+        model = _model_cache.get(key)
+        if model is not None:
+            _model_cache_stats["hits"] += 1
+        else:
+            build_lock = _model_build_locks.setdefault(key, threading.Lock())
+
+    if model is None:
+        # Build outside the shared lock; only callers wanting this model wait
+        with build_lock:
+            # Another agent may have built it while we waited
+            with _cache_lock:
+                model = _model_cache.get(key)
+                if model is not None:
+                    _model_cache_stats["hits"] += 1
+
+            if model is None:
+                outcome = "miss"
+                model = _build_model(model_id, region)
+                with _cache_lock:
+                    _model_cache[key] = model
+                    _model_cache_stats["misses"] += 1
+                    _model_build_locks.pop(key, None)
+
+    _module_logger.debug(
+        "Model cache %s for %s (%s): hits=%d, misses=%d",
+        outcome,
+        model_id,
+        region,
+        _model_cache_stats["hits"],
+        _model_cache_stats["misses"],
+    )
+    return model
+
+
+def _get_or_create_tools(agent: "BaseAgent") -> list:
+    """Get the tool list for an agent class, resolving get_tools() once per class."""
+    if not _MODEL_CACHE_ENABLED:
+        return agent.get_tools()
+
+    agent_cls = type(agent)
+    with _cache_lock:
+        tools = _tools_cache.get(agent_cls)
+        if tools is None:
+            tools = agent.get_tools()
+            _tools_cache[agent_cls] = tools
+
+    # Hand out a copy so one agent can't mutate another's tool list
+    return list(tools)
+
+
+@functools.lru_cache(maxsize=64)
+def _resolve_agent_config(agent_type: str) -> AgentConfig:
+    """Resolve and validate the agents.yaml config for an agent type once per process."""
+    return AgentConfig(**get_agent_config(agent_type))
+
+
+def clear_model_cache() -> None:
+    """Clear the shared model, tool and agent config caches (e.g. after a config reload)."""
+    _resolve_agent_config.cache_clear()
+    with _cache_lock:
+        _model_cache.clear()
+        _model_build_locks.clear()
+        _tools_cache.clear()
+        _model_cache_stats["hits"] = 0
+        _model_cache_stats["misses"] = 0
+
+
+def _ns_to_iso(ns: int) -> str:
+    """Format a time.time_ns() timestamp as a UTC ISO string."""
+    return datetime.fromtimestamp(ns / 1e9, UTC).isoformat()
+
+
+def _check_state_fields(cls: type, data: object, nested: tuple[str, ...] = ()) -> dict:
+    """
+    Check a state dictionary against a dataclass's scalar field types.
+
+    State dicts can come from clients (payload state blobs), so every
+    mismatch is reported as ValueError rather than failing later.
 
-def _utc_now_iso() -> str:
-    """Get current UTC time as ISO string."""
-    return datetime.now(UTC).isoformat()
+    Args:
+        cls: Dataclass the dictionary describes.
+        data: Candidate state dictionary.
+        nested: Field names whose values are checked by the caller.
 
+    Returns:
+        The dictionary, unchanged.
 
-class AgentAction(BaseModel):
-    """Record of a single agent action."""
+    Raises:
+        ValueError: If data is not a dict, has unknown or missing fields,
+            or a field has the wrong type.
+    """
+    if not isinstance(data, dict):
+        raise ValueError(f"{cls.__name__} state must be an object")
+
+    known = {f.name: f for f in fields(cls) if f.init}
+    unknown = data.keys() - known.keys()
+    if unknown:
+        raise ValueError(f"Unknown {cls.__name__} fields: {', '.join(sorted(map(str, unknown)))}")
+
+    for name, f in known.items():
+        if name not in data:
+            if f.default is MISSING and f.default_factory is MISSING:
+                raise ValueError(f"Missing {cls.__name__} field: {name}")
+            continue
+        if name in nested:
+            continue
+        value = data[name]
+        # bool is an int subclass, so ints and bools must match exactly
+        if not isinstance(value, f.type) or (type(value) is bool) != (f.type is bool):
+            raise ValueError(f"Invalid {cls.__name__} field {name}: expected {f.type.__name__}")
+
+    return data
+
+
+@dataclass(slots=True, kw_only=True)
+class AgentAction:
+    """Record of a single agent action.
+
+    Timestamps are stored as nanoseconds since the epoch and only formatted
+    when exported (see to_dict). The internal state round trip keeps them as
+    integers (see to_state_dict).
+    """
 
-    timestamp: str = Field(default_factory=_utc_now_iso)
+    timestamp: int = field(default_factory=time.time_ns)
     action_type: str
     description: str
     input_summary: str = ""
@@ -35,20 +200,95 @@ class AgentAction(BaseModel):
     success: bool = True
     error_message: str = ""
     duration_ms: int = 0
+    # Serialized fields, built on the first to_dict() call; actions are not
+    # modified once recorded, so reports reuse it instead of re-serializing
+    _serialized: dict | None = field(default=None, init=False, repr=False, compare=False)
+
+    def to_dict(self) -> dict:
+        """Serialize the action to a plain dictionary with an ISO timestamp."""
+        if self._serialized is None:
+            data = self.to_state_dict()
+            data["timestamp"] = self.timestamp_iso
+            self._serialized = data
+        return self._serialized.copy()
+
+    def to_state_dict(self) -> dict:
+        """Serialize the action for an AgentState round trip, keeping the ns timestamp."""
+        # All fields are scalars, so skip asdict()'s recursive deep copy
+        return {name: getattr(self, name) for name in _ACTION_FIELDS}
+
+    @property
+    def timestamp_iso(self) -> str:
+        """Action timestamp as a UTC ISO string."""
+        return _ns_to_iso(self.timestamp)
+
+    @classmethod
+    def from_state_dict(cls, data: dict) -> "AgentAction":
+        """
+        Build an action from a dictionary produced by to_state_dict().
+
+        Raises:
+            ValueError: If the dictionary is not a valid action.
+        """
+        return cls(**_check_state_fields(cls, data))
+
 
+_ACTION_FIELDS = tuple(f.name for f in fields(AgentAction) if f.init)
 
-class AgentState(BaseModel):
+
+@dataclass(slots=True, kw_only=True)
+class AgentState:
     """State tracking for an agent instance."""
 
     agent_id: str
     agent_name: str
-    created_at: str = Field(default_factory=_utc_now_iso)
-    last_activity: str = Field(default_factory=_utc_now_iso)
-    action_history: list[AgentAction] = Field(default_factory=list)
+    created_at: int = field(default_factory=time.time_ns)
+    last_activity: int = field(default_factory=time.time_ns)
+    action_history: deque[AgentAction] = field(
+        default_factory=lambda: deque(maxlen=_ACTION_HISTORY_MAX)
+    )
     total_invocations: int = 0
     successful_invocations: int = 0
     failed_invocations: int = 0
 
+    def to_dict(self) -> dict:
+        """Serialize the state, including its action history, with ISO timestamps."""
+        data = {f.name: getattr(self, f.name) for f in fields(self)}
+        data["created_at"] = _ns_to_iso(self.created_at)
+        data["last_activity"] = self.last_activity_iso
+        data["action_history"] = [action.to_dict() for action in self.action_history]
+        return data
+
+    def to_state_dict(self) -> dict:
+        """Serialize the state for a round trip through from_state_dict (ns timestamps)."""
+        data = {f.name: getattr(self, f.name) for f in fields(self)}
+        data["action_history"] = [action.to_state_dict() for action in self.action_history]
+        return data
+
+    @property
+    def last_activity_iso(self) -> str:
+        """Last activity time as a UTC ISO string."""
+        return _ns_to_iso(self.last_activity)
+
+    @classmethod
+    def from_state_dict(cls, data: dict) -> "AgentState":
+        """
+        Build a state from a dictionary produced by to_state_dict().
+
+        Raises:
+            ValueError: If the dictionary is not a valid state.
+        """
+        _check_state_fields(cls, data, nested=("action_history",))
+        actions = data.get("action_history", [])
+        if not isinstance(actions, list):
+            raise ValueError("Invalid AgentState field action_history: expected list")
+
+        history = deque(
+            (AgentAction.from_state_dict(a) for a in actions),
+            maxlen=_ACTION_HISTORY_MAX,
+        )
+        return cls(**{**data, "action_history": history})
+
 
 class BaseAgent(ABC):
     """
@@ -73,6 +313,18 @@ class BaseAgent(ABC):
                 return self._agent(message)
     """
 
+    # Fixed attribute layout; subclasses without __slots__ still get a __dict__
+    __slots__ = (
+        "_agent_type",
+        "_agent_id",
+        "_settings",
+        "_config",
+        "_logger",
+        "_state",
+        "_model",
+        "_agent",
+    )
+
     def __init__(
         self,
         agent_type: str,
@@ -80,6 +332,7 @@ class BaseAgent(ABC):
         model_id: str | None = None,
         region: str | None = None,
         session_manager: Any | None = None,
+        messages: list | None = None,
     ):
         """
         Initialize the base agent.
@@ -91,18 +344,14 @@ class BaseAgent(ABC):
             model_id: Optional model ID to override config.
             region: Optional AWS region to override config.
             session_manager: Optional session manager for conversation persistence.
+            messages: Optional conversation messages to seed the agent with.
         """
         self._agent_type = agent_type
-        self._agent_id = f"{agent_type}-{uuid.uuid4().hex[:8]}"
+        self._agent_id = f"{agent_type}-{os.urandom(4).hex()}"
 
-        # Load configuration
+        # Load configuration (load_settings is cached by the config loader)
         self._settings = load_settings()
-
-        if custom_config:
-            self._config = custom_config
-        else:
-            agent_cfg = get_agent_config(agent_type)
-            self._config = AgentConfig(**agent_cfg)
+        self._config = custom_config or _resolve_agent_config(agent_type)
 
         # Initialize logger
         self._logger = get_logger(
@@ -120,22 +369,24 @@ class BaseAgent(ABC):
         effective_region = region or self._settings.get("aws", {}).get("region", "us-east-1")
         effective_model_id = model_id or self._config.model_id
 
-        self._model = BedrockModel(
-            model_id=effective_model_id,
-            region_name=effective_region,
-        )
+        self._model = _get_or_create_model(effective_model_id, effective_region)
 
         # Initialize the Strands agent
-        self._agent = self._create_agent(session_manager)
+        self._agent = self._create_agent(session_manager, messages)
 
         self._logger.info(f"Initialized {self._config.name} with model {effective_model_id}")
 
-    def _create_agent(self, session_manager: Any | None = None) -> Agent:
+    def _create_agent(
+        self,
+        session_manager: Any | None = None,
+        messages: list | None = None,
+    ) -> Agent:
         """
         Create the Strands Agent instance.
 
         Args:
             session_manager: Optional session manager for persistence.
+            messages: Optional conversation messages to seed the agent with.
 
         Returns:
             Configured Agent instance.
@@ -143,7 +394,7 @@ class BaseAgent(ABC):
         agent_kwargs = {
             "model": self._model,
             "system_prompt": self._config.system_prompt,
-            "tools": self.get_tools(),
+            "tools": _get_or_create_tools(self),
             "name": self._config.name,
             "description": self._config.description,
         }
@@ -151,6 +402,9 @@ class BaseAgent(ABC):
         if session_manager:
             agent_kwargs["session_manager"] = session_manager
 
+        if messages:
+            agent_kwargs["messages"] = messages
+
         return Agent(**agent_kwargs)
 
     @property
@@ -174,8 +428,8 @@ class BaseAgent(ABC):
         return self._state
 
     @property
-    def action_history(self) -> list[AgentAction]:
-        """Get the action history."""
+    def action_history(self) -> deque[AgentAction]:
+        """Get the most recent actions (bounded by AGENT_ACTION_HISTORY_MAX)."""
         return self._state.action_history
 
     @property
@@ -201,10 +455,10 @@ class BaseAgent(ABC):
 
     def record_action(
         self,
-        action_type: str,
-        description: str,
-        input_summary: str = "",
-        output_summary: str = "",
+        action_type: str | AgentAction,
+        description: str = "",
+        input_summary: str | Callable[[], str] = "",
+        output_summary: str | Callable[[], str] = "",
         success: bool = True,
         error_message: str = "",
         duration_ms: int = 0,
@@ -212,27 +466,50 @@ class BaseAgent(ABC):
         """
         Record an action in the agent's history.
 
+        Summaries that are expensive to build (e.g. list reprs) can be passed
+        as callables; they are only called when action history is kept
+        (AGENT_ACTION_HISTORY_MAX > 0). An already built AgentAction can be
+        passed instead of the individual fields and is recorded as-is.
+
         Args:
-            action_type: Type of action (e.g., "invoke", "tool_call").
+            action_type: Type of action (e.g., "invoke", "tool_call"), or an
+                        AgentAction to record directly.
             description: Human-readable description of the action.
-            input_summary: Summary of the input.
-            output_summary: Summary of the output.
+            input_summary: Summary of the input, or a callable returning it.
+            output_summary: Summary of the output, or a callable returning it.
             success: Whether the action succeeded.
             error_message: Error message if action failed.
             duration_ms: Duration of the action in milliseconds.
         """
-        action = AgentAction(
-            action_type=action_type,
-            description=description,
-            input_summary=input_summary[:500] if input_summary else "",
-            output_summary=output_summary[:500] if output_summary else "",
-            success=success,
-            error_message=error_message,
-            duration_ms=duration_ms,
-        )
+        history = self._state.action_history
+
+        if isinstance(action_type, AgentAction):
+            action = action_type
+            success = action.success
+            if history.maxlen != 0:
+                history.append(action)
+            self._state.last_activity = action.timestamp
+        elif history.maxlen == 0:
+            # History disabled: keep the counters, skip building the record
+            self._state.last_activity = time.time_ns()
+        else:
+            if callable(input_summary):
+                input_summary = input_summary()
+            if callable(output_summary):
+                output_summary = output_summary()
+
+            action = AgentAction(
+                action_type=action_type,
+                description=description,
+                input_summary=input_summary[:500] if input_summary else "",
+                output_summary=output_summary[:500] if output_summary else "",
+                success=success,
+                error_message=error_message,
+                duration_ms=duration_ms,
+            )
 
-        self._state.action_history.append(action)
-        self._state.last_activity = datetime.now(UTC).isoformat()
+            history.append(action)
+            self._state.last_activity = action.timestamp
 
         if success:
             self._state.successful_invocations += 1
@@ -254,14 +531,14 @@ class BaseAgent(ABC):
         Returns:
             The agent's response as a string.
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         self._logger.info(f"Invoking agent with message: {message[:100]}...")
 
         try:
             result = self._agent(message, **kwargs)
             response = str(result)
-            duration_ms = int((time.time() - start_time) * 1000)
+            duration_ms = int((time.perf_counter() - start_time) * 1000)
 
             self.record_action(
                 action_type="invoke",
@@ -276,7 +553,7 @@ class BaseAgent(ABC):
             return response
 
         except Exception as e:
-            duration_ms = int((time.time() - start_time) * 1000)
+            duration_ms = int((time.perf_counter() - start_time) * 1000)
             error_msg = str(e)
 
             self.record_action(
@@ -291,32 +568,42 @@ class BaseAgent(ABC):
             self._logger.error(f"Agent invocation failed: {error_msg}")
             raise
 
-    async def ainvoke(self, message: str, **kwargs) -> str:
+    async def ainvoke(self, message: str, stream: bool = False, **kwargs) -> str:
         """
         Asynchronously invoke the agent with a message.
 
         Args:
             message: The user message or task description.
+            stream: Consume the agent's event stream and assemble the response
+                   from text chunks. When False (default), the agent is invoked
+                   directly and only the final result is materialized. Implied
+                   when a "callback" is passed, since callbacks receive stream events.
             **kwargs: Additional arguments passed to the agent.
 
         Returns:
             The agent's response as a string.
         """
-        # Strands SDK supports async via the agent's async methods
-
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         self._logger.info(f"Async invoking agent with message: {message[:100]}...")
 
         try:
-            # Use the agent's async streaming or invoke method
-            result = self._agent.stream_async(message, **kwargs)
-            response = ""
-            async for event in result:
-                if hasattr(event, "data"):
-                    response += str(event.data)
-
-            duration_ms = int((time.time() - start_time) * 1000)
+            if stream or "callback" in kwargs:
+                parts: list[str] = []
+                async for event in self._agent.stream_async(message, **kwargs):
+                    # Strands emits dict events; text chunks carry a "data" key
+                    if isinstance(event, dict):
+                        data = event.get("data")
+                    else:
+                        data = getattr(event, "data", None)
+                    if data is not None:
+                        parts.append(str(data))
+                response = "".join(parts)
+            else:
+                result = await self._agent.invoke_async(message, **kwargs)
+                response = str(result)
+
+            duration_ms = int((time.perf_counter() - start_time) * 1000)
 
             self.record_action(
                 action_type="async_invoke",
@@ -330,7 +617,7 @@ class BaseAgent(ABC):
             return response
 
         except Exception as e:
-            duration_ms = int((time.time() - start_time) * 1000)
+            duration_ms = int((time.perf_counter() - start_time) * 1000)
 
             self.record_action(
                 action_type="async_invoke",
@@ -354,22 +641,33 @@ class BaseAgent(ABC):
         if not self._state.action_history:
             return f"{self.agent_name} has not performed any actions yet."
 
-        lines = [
-            f"## {self.agent_name} Action Summary",
-            f"Total invocations: {self._state.total_invocations}",
-            f"Successful: {self._state.successful_invocations}",
-            f"Failed: {self._state.failed_invocations}",
-            "",
-            "### Action History:",
-        ]
-
-        for i, action in enumerate(self._state.action_history, 1):
-            status = "✓" if action.success else "✗"
-            lines.append(f"{i}. [{status}] {action.action_type}: {action.description}")
-            if action.error_message:
-                lines.append(f"   Error: {action.error_message}")
-
-        return "\n".join(lines)
+        state = self._state
+        history = "\n".join(
+            f"{i}. [{_STATUS_MARKS[action.success]}] {action.action_type}: {action.description}"
+            + (f"\n   Error: {action.error_message}" if action.error_message else "")
+            for i, action in enumerate(state.action_history, 1)
+        )
+
+        return (
+            f"## {self.agent_name} Action Summary\n"
+            f"Total invocations: {state.total_invocations}\n"
+            f"Successful: {state.successful_invocations}\n"
+            f"Failed: {state.failed_invocations}\n"
+            "\n"
+            "### Action History:\n"
+            f"{history}"
+        )
+
+    def restore_state(self, state: AgentState) -> None:
+        """
+        Restore action history and counters from a previously exported state.
+
+        The restored state is re-attributed to this agent's ID and name.
+
+        Args:
+            state: State exported from another instance (e.g. via AgentState.to_state_dict()).
+        """
+        self._state = replace(state, agent_id=self._agent_id, agent_name=self._config.name)
 
     def reset_state(self) -> None:
         """Reset the agent's state and action history."""
@@ -13,6 +13,14 @@ from ..tools.code_analysis_tools import (
 )
 from .base import BaseAgent
 
+# Recommended action per severity level
+_RECOMMENDATIONS = {
+    "critical": "Immediate action required. Escalate to on-call team.",
+    "high": "Urgent attention needed. Create high-priority ticket.",
+    "medium": "Should be addressed soon. Schedule for next sprint.",
+    "low": "Monitor and address when convenient.",
+}
+
 
 class CodingAgent(BaseAgent):
     """
@@ -40,6 +48,8 @@ class CodingAgent(BaseAgent):
         swarm = Swarm(agents=[coding_agent.inner_agent, ...])
     """
 
+    __slots__ = ("_code_analyzer",)
+
     def __init__(
         self,
         model_id: str | None = None,
@@ -52,8 +62,8 @@ class CodingAgent(BaseAgent):
             model_id: Optional Bedrock model ID override.
             region: Optional AWS region override.
         """
-        # Initialize the code analyzer for direct tool access
-        self._analyzer = CodeAnalyzer()
+        # Code analyzer for direct tool access, built on first use
+        self._code_analyzer: CodeAnalyzer | None = None
 
         super().__init__(
             agent_type="coding",
@@ -61,6 +71,13 @@ class CodingAgent(BaseAgent):
             region=region,
         )
 
+    @property
+    def _analyzer(self) -> CodeAnalyzer:
+        """Get or create the code analyzer."""
+        if self._code_analyzer is None:
+            self._code_analyzer = CodeAnalyzer()
+        return self._code_analyzer
+
     def get_tools(self) -> list:
         """Get the coding-specific tools."""
         return [
@@ -89,13 +106,7 @@ class CodingAgent(BaseAgent):
         self._logger.info("Analyzing log context for error patterns")
 
         patterns = self._analyzer.analyze_patterns(log_context)
-
-        self.record_action(
-            action_type="analyze_patterns",
-            description=f"Analyzed logs, found {len(patterns.get('error_types', []))} error types",
-            input_summary=f"Log context: {len(log_context)} chars",
-            output_summary=f"Error types: {patterns.get('error_types', [])}",
-        )
+        self._record_patterns(log_context, patterns)
 
         return patterns
 
@@ -117,13 +128,7 @@ class CodingAgent(BaseAgent):
         self._logger.info(f"Generating fix suggestions for {service_name or 'unknown service'}")
 
         suggestions = self._analyzer.suggest_fixes(patterns, service_name)
-
-        self.record_action(
-            action_type="suggest_fixes",
-            description=f"Generated {len(suggestions)} fix suggestions",
-            input_summary=f"Service: {service_name}, Patterns: {patterns.get('error_types', [])}",
-            output_summary=f"Suggestions: {[s.get('error_type') for s in suggestions]}",
-        )
+        self._record_suggestions(patterns, suggestions, service_name)
 
         return suggestions
 
@@ -137,25 +142,7 @@ class CodingAgent(BaseAgent):
         Returns:
             Severity assessment with recommendation.
         """
-        severity = self._analyzer.assess_severity(patterns)
-
-        error_count = len(patterns.get("error_types", []))
-        recurring_count = len(patterns.get("recurring_issues", []))
-
-        recommendations = {
-            "critical": "Immediate action required. Escalate to on-call team.",
-            "high": "Urgent attention needed. Create high-priority ticket.",
-            "medium": "Should be addressed soon. Schedule for next sprint.",
-            "low": "Monitor and address when convenient.",
-        }
-
-        return {
-            "severity": severity,
-            "error_count": error_count,
-            "recurring_count": recurring_count,
-            "affected_services": patterns.get("affected_services", []),
-            "recommendation": recommendations.get(severity, "Review and assess"),
-        }
+        return self._severity_assessment(patterns, self._analyzer.assess_severity(patterns))
 
     def full_analysis(
         self,
@@ -177,14 +164,14 @@ class CodingAgent(BaseAgent):
         Returns:
             Complete analysis report.
         """
-        # Step 1: Analyze patterns
-        patterns = self.analyze_logs(log_context)
+        self._logger.info(f"Running full analysis for {service_name or 'unknown service'}")
 
-        # Step 2: Assess severity
-        severity_assessment = self.get_severity(patterns)
+        # Patterns, severity and suggestions from one analyzer call
+        patterns, severity, suggestions = self._analyzer.full_pass(log_context, service_name)
 
-        # Step 3: Get fix suggestions
-        suggestions = self.get_fix_suggestions(patterns, service_name)
+        self._record_patterns(log_context, patterns)
+        severity_assessment = self._severity_assessment(patterns, severity)
+        self._record_suggestions(patterns, suggestions, service_name)
 
         report = {
             "service": service_name or "Unknown",
@@ -204,6 +191,47 @@ class CodingAgent(BaseAgent):
 
         return report
 
+    def _record_patterns(self, log_context: str, patterns: dict) -> None:
+        """Record a pattern analysis action."""
+        error_types = patterns["error_types"]
+
+        self.record_action(
+            action_type="analyze_patterns",
+            description=f"Analyzed logs, found {len(error_types)} error types",
+            input_summary=f"Log context: {len(log_context)} chars",
+            output_summary=lambda: f"Error types: {error_types}",
+        )
+
+    def _record_suggestions(
+        self,
+        patterns: dict,
+        suggestions: list[dict],
+        service_name: str,
+    ) -> None:
+        """Record a fix suggestion action."""
+        self.record_action(
+            action_type="suggest_fixes",
+            description=f"Generated {len(suggestions)} fix suggestions",
+            input_summary=lambda: (
+                f"Service: {service_name}, Patterns: {patterns.get('error_types', [])}"
+            ),
+            output_summary=lambda: f"Suggestions: {[s.get('error_type') for s in suggestions]}",
+        )
+
+    def _severity_assessment(self, patterns: dict, severity: str) -> dict:
+        """Build the severity assessment returned by get_severity."""
+        # Empty tuple defaults avoid allocating a fresh list per lookup
+        error_count = len(patterns.get("error_types") or ())
+        recurring_count = len(patterns.get("recurring_issues") or ())
+
+        return {
+            "severity": severity,
+            "error_count": error_count,
+            "recurring_count": recurring_count,
+            "affected_services": patterns.get("affected_services", []),
+            "recommendation": _RECOMMENDATIONS.get(severity, "Review and assess"),
+        }
+
     def _generate_summary(
         self,
         patterns: dict,
@@ -211,35 +239,39 @@ class CodingAgent(BaseAgent):
         suggestions: list[dict],
     ) -> str:
         """Generate a human-readable summary of the analysis."""
-        lines = [
-            "## Analysis Summary",
-            "",
-            f"**Severity Level:** {severity['severity'].upper()}",
-            f"**Recommendation:** {severity['recommendation']}",
-            "",
-            "### Findings",
-            f"- Error types identified: {len(patterns.get('error_types', []))}",
-            f"- Recurring issues: {len(patterns.get('recurring_issues', []))}",
-            f"- Services affected: {', '.join(patterns.get('affected_services', ['None']))}",
-            "",
+        error_types = patterns.get("error_types") or ()
+        recurring = patterns.get("recurring_issues") or ()
+        causes = patterns.get("potential_causes")
+
+        # Each section ends with a newline and sections are separated by a blank line
+        sections = [
+            "## Analysis Summary\n"
+            "\n"
+            f"**Severity Level:** {severity['severity'].upper()}\n"
+            f"**Recommendation:** {severity['recommendation']}\n"
+            "\n"
+            "### Findings\n"
+            f"- Error types identified: {len(error_types)}\n"
+            f"- Recurring issues: {len(recurring)}\n"
+            f"- Services affected: {', '.join(patterns.get('affected_services', ['None']))}\n"
         ]
 
-        if patterns.get("potential_causes"):
-            lines.append("### Potential Causes")
-            for cause in patterns["potential_causes"]:
-                lines.append(f"- {cause}")
-            lines.append("")
+        if causes:
+            sections.append(
+                "### Potential Causes\n" + "".join(f"- {cause}\n" for cause in causes)
+            )
 
         if suggestions:
-            lines.append("### Suggested Fixes")
-            for i, suggestion in enumerate(suggestions, 1):
-                lines.append(
+            sections.append(
+                "### Suggested Fixes\n"
+                + "".join(
                     f"{i}. **{suggestion.get('error_type', 'General')}**: "
-                    f"{suggestion.get('suggestion', 'Review code')}"
+                    f"{suggestion.get('suggestion', 'Review code')}\n"
+                    for i, suggestion in enumerate(suggestions, 1)
                 )
-            lines.append("")
+            )
 
-        return "\n".join(lines)
+        return "\n".join(sections)
 
     def analyze_with_llm(
         self,
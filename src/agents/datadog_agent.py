@@ -5,7 +5,10 @@ Specialist agent for fetching and analyzing logs from DataDog.
 Can be used standalone or as part of the multi-agent swarm.
 """
 
+from collections import Counter
+
 from ..tools.datadog_tools import (
+    NO_ATTRIBUTES,
     DataDogClient,
     extract_unique_services,
     format_logs_for_analysis,
@@ -13,6 +16,9 @@ from ..tools.datadog_tools import (
 )
 from .base import BaseAgent
 
+# Error/warning query for a single service
+_SERVICE_ERROR_QUERY = "service:{} status:(error OR warn)".format
+
 
 class DataDogAgent(BaseAgent):
     """
@@ -40,6 +46,8 @@ class DataDogAgent(BaseAgent):
         swarm = Swarm(agents=[datadog_agent.inner_agent, ...])
     """
 
+    __slots__ = ("_client_kwargs", "_client")
+
     def __init__(
         self,
         model_id: str | None = None,
@@ -58,12 +66,9 @@ class DataDogAgent(BaseAgent):
             app_key: Optional DataDog Application key (defaults to env var).
             datadog_site: Optional DataDog site (us1, us5, eu1, etc.).
         """
-        # Initialize the DataDog client for direct tool access
-        self._datadog_client = DataDogClient(
-            api_key=api_key,
-            app_key=app_key,
-            site=datadog_site,
-        )
+        # DataDog client for direct tool access, built on first use
+        self._client_kwargs = {"api_key": api_key, "app_key": app_key, "site": datadog_site}
+        self._client: DataDogClient | None = None
 
         super().__init__(
             agent_type="datadog",
@@ -71,6 +76,13 @@ class DataDogAgent(BaseAgent):
             region=region,
         )
 
+    @property
+    def _datadog_client(self) -> DataDogClient:
+        """Get or create the DataDog client."""
+        if self._client is None:
+            self._client = DataDogClient(**self._client_kwargs)
+        return self._client
+
     def get_tools(self) -> list:
         """Get the DataDog-specific tools."""
         return [
@@ -133,8 +145,19 @@ class DataDogAgent(BaseAgent):
         Returns:
             Sorted list of unique service names.
         """
-        services = self._datadog_client.extract_services(logs)
-        return sorted(list(services))
+        return sorted(self._datadog_client.extract_services(logs))
+
+    def group_logs_by_service(self, logs: list[dict]) -> dict[str, list[dict]]:
+        """
+        Group logs by service in a single pass.
+
+        Args:
+            logs: List of log entries.
+
+        Returns:
+            Dictionary mapping service name to its log entries.
+        """
+        return self._datadog_client.group_by_service(logs)
 
     def format_logs(
         self,
@@ -177,7 +200,7 @@ class DataDogAgent(BaseAgent):
             Dictionary with logs and formatted context.
         """
         # Fetch logs filtered by service
-        query = f"service:{service_name} status:(error OR warn)"
+        query = _SERVICE_ERROR_QUERY(service_name)
         logs = self.fetch_logs(
             time_from=time_from,
             time_to=time_to,
@@ -203,31 +226,35 @@ class DataDogAgent(BaseAgent):
             Dictionary with error summary by service.
         """
         logs = self.fetch_logs(time_from="now-1d", time_to="now")
-        services = self.get_services(logs)
+
+        # Column-wise: pull the service and status columns out once, then let
+        # Counter tally (service, is_error) pairs in C
+        attrs = [log.get("attributes") or NO_ATTRIBUTES for log in logs]
+        pair_counts = Counter(
+            zip(
+                [a.get("service") for a in attrs],
+                [a.get("status") == "error" for a in attrs],
+            )
+        )
+
+        services = sorted({service for service, _ in pair_counts if service})
+
+        by_service = {}
+        for service in services:
+            errors = pair_counts[(service, True)]
+            warnings = pair_counts[(service, False)]
+            by_service[service] = {
+                "total": errors + warnings,
+                "errors": errors,
+                "warnings": warnings,
+            }
 
         summary = {
             "total_logs": len(logs),
             "services_affected": services,
-            "by_service": {},
+            "by_service": by_service,
         }
 
-        for service in services:
-            service_logs = [
-                log for log in logs if log.get("attributes", {}).get("service") == service
-            ]
-
-            # Count by status
-            error_count = sum(
-                1 for log in service_logs if log.get("attributes", {}).get("status") == "error"
-            )
-            warn_count = len(service_logs) - error_count
-
-            summary["by_service"][service] = {
-                "total": len(service_logs),
-                "errors": error_count,
-                "warnings": warn_count,
-            }
-
         self.record_action(
             action_type="daily_summary",
             description="Generated daily error summary",
@@ -5,16 +5,51 @@ Central coordinator agent that manages all specialist agents and user interactio
 Maintains conversation history and generates comprehensive reports.
 """
 
-from ..memory import create_agentcore_session_manager
+import asyncio
+import heapq
+import threading
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import repeat
+from operator import attrgetter
+from typing import TYPE_CHECKING
+
+from ..memory import LazySessionManager, create_agentcore_session_manager
+from ..tools.code_analysis_tools import analyze_error_patterns
+from ..tools.datadog_tools import query_logs
+from ..tools.servicenow_tools import create_incident, search_incidents
 from ..utils.logging_config import get_logger
 from .base import BaseAgent
-from .coding_agent import CodingAgent
-from .datadog_agent import DataDogAgent
-from .servicenow_agent import ServiceNowAgent
+
+if TYPE_CHECKING:
+    from .coding_agent import CodingAgent
+    from .datadog_agent import DataDogAgent
+    from .servicenow_agent import ServiceNowAgent
 
 # Module-level logger for use before instance is initialized
 _module_logger = get_logger("agents.orchestrator")
 
+# Default upper bound on concurrent per-service ServiceNow calls in analyze_and_report
+# (overridable via workflow.max_parallel_tickets in settings.yaml)
+_MAX_SERVICE_WORKERS = 8
+
+# Default number of most recent per-stage agent reports kept for generate_report
+# (overridable via workflow.max_agent_reports in settings.yaml)
+_AGENT_REPORTS_MAX = 1024
+
+# Workflow summary headings
+_SUMMARY_HEADER = "## AIOps Workflow Summary\n\n"
+_SECTION_LOG_COLLECTION = "### Log Collection\n"
+_SECTION_ANALYSIS = "### Analysis Results\n"
+_SECTION_TICKETS = "### Tickets Created\n"
+# Shown when the DataDog stage recorded no service list
+_NO_SERVICES = ("None",)
+
+# Severities that warrant a ServiceNow ticket; low severity issues are only reported
+_TICKET_SEVERITIES = frozenset({"critical", "high", "medium"})
+
 
 class OrchestratorAgent(BaseAgent):
     """
@@ -54,6 +89,7 @@ class OrchestratorAgent(BaseAgent):
         session_id: str | None = None,
         enable_memory: bool = True,
         actor_id: str | None = None,
+        messages: list | None = None,
     ):
         """
         Initialize the Orchestrator Agent.
@@ -66,29 +102,42 @@ class OrchestratorAgent(BaseAgent):
             enable_memory: Whether to enable memory persistence. Set to False for
                           stateless operations like proactive workflows. Defaults to True.
             actor_id: Optional actor ID for AgentCore Memory. Defaults to session_id.
+            messages: Optional conversation messages to seed the agent with (e.g. from
+                     a payload state blob). A new memory session persists them.
         """
-        # Create session manager if session_id provided AND memory is enabled
+        # Create session manager if session_id provided AND memory is enabled;
+        # the real manager is only built once the orchestrator is first invoked
         session_manager = None
         if session_id and enable_memory:
-            session_manager = self._create_session_manager(
-                session_id=session_id,
-                actor_id=actor_id or session_id,
-                region=region,
+            session_manager = LazySessionManager(
+                partial(
+                    self._create_session_manager,
+                    session_id=session_id,
+                    actor_id=actor_id or session_id,
+                    region=region,
+                )
             )
 
-        # Initialize specialist agents (lazy loaded)
+        # Initialize specialist agents (lazy loaded; the lock stops concurrent
+        # workflow stages from building the same specialist twice)
+        self._specialist_lock = threading.Lock()
         self._datadog_agent: DataDogAgent | None = None
         self._coding_agent: CodingAgent | None = None
         self._servicenow_agent: ServiceNowAgent | None = None
 
-        # Store all agent reports for final summary
-        self._agent_reports: list[dict] = []
-
         super().__init__(
             agent_type="orchestrator",
             model_id=model_id,
             region=region,
             session_manager=session_manager,
+            messages=messages,
+        )
+
+        self._session_manager = session_manager
+
+        # Store agent reports for the final summary; the oldest are evicted first
+        self._agent_reports: deque[dict] = deque(
+            maxlen=self._settings.get("workflow", {}).get("max_agent_reports", _AGENT_REPORTS_MAX)
         )
 
     @staticmethod
@@ -113,13 +162,31 @@ class OrchestratorAgent(BaseAgent):
         Returns:
             A session manager instance.
         """
-        _module_logger.info(f"Creating session manager for: {session_id}")
+        _module_logger.info("Creating session manager for: %s", session_id)
         return create_agentcore_session_manager(
             session_id=session_id,
             actor_id=actor_id,
             region=region,
         )
 
+    def persist_session(self) -> None:
+        """
+        Write the conversation to the memory session now.
+
+        The session manager is otherwise only attached on the first invocation,
+        so a seeded conversation would be lost if this orchestrator were
+        discarded before being invoked. No-op when memory is disabled.
+        """
+        if self._session_manager is not None:
+            self._session_manager.initialize(self.inner_agent)
+
+    def _service_executor(self, service_count: int) -> ThreadPoolExecutor:
+        """Create a thread pool sized for concurrent per-service calls."""
+        max_workers = self._settings.get("workflow", {}).get(
+            "max_parallel_tickets", _MAX_SERVICE_WORKERS
+        )
+        return ThreadPoolExecutor(max_workers=max(1, min(service_count, max_workers)))
+
     def get_tools(self) -> list:
         """
         Get the orchestrator's tools.
@@ -127,11 +194,6 @@ class OrchestratorAgent(BaseAgent):
         The orchestrator primarily uses specialist agents rather than
         direct tools, but may have utility tools for reporting.
         """
-        # Import here to avoid circular dependency
-        from ..tools.code_analysis_tools import analyze_error_patterns
-        from ..tools.datadog_tools import query_logs
-        from ..tools.servicenow_tools import create_incident, search_incidents
-
         # The orchestrator can access high-level tools from all agents
         return [query_logs, analyze_error_patterns, create_incident, search_incidents]
 
@@ -140,24 +202,39 @@ class OrchestratorAgent(BaseAgent):
     # ==========================================
 
     @property
-    def datadog_agent(self) -> DataDogAgent:
+    def datadog_agent(self) -> "DataDogAgent":
         """Get or create the DataDog agent."""
         if self._datadog_agent is None:
-            self._datadog_agent = DataDogAgent()
+            with self._specialist_lock:
+                if self._datadog_agent is None:
+                    # Imported on first use, so an unused specialist module is never loaded
+                    from .datadog_agent import DataDogAgent
+
+                    self._datadog_agent = DataDogAgent()
         return self._datadog_agent
 
     @property
-    def coding_agent(self) -> CodingAgent:
+    def coding_agent(self) -> "CodingAgent":
         """Get or create the Coding agent."""
         if self._coding_agent is None:
-            self._coding_agent = CodingAgent()
+            with self._specialist_lock:
+                if self._coding_agent is None:
+                    # Imported on first use, so an unused specialist module is never loaded
+                    from .coding_agent import CodingAgent
+
+                    self._coding_agent = CodingAgent()
         return self._coding_agent
 
     @property
-    def servicenow_agent(self) -> ServiceNowAgent:
+    def servicenow_agent(self) -> "ServiceNowAgent":
         """Get or create the ServiceNow agent."""
         if self._servicenow_agent is None:
-            self._servicenow_agent = ServiceNowAgent()
+            with self._specialist_lock:
+                if self._servicenow_agent is None:
+                    # Imported on first use, so an unused specialist module is never loaded
+                    from .servicenow_agent import ServiceNowAgent
+
+                    self._servicenow_agent = ServiceNowAgent()
         return self._servicenow_agent
 
     # ==========================================
@@ -191,8 +268,9 @@ class OrchestratorAgent(BaseAgent):
         Returns:
             Complete workflow result including analysis, tickets, and summary.
         """
-        self._logger.info(f"Starting full analysis workflow for: {user_request[:100]}")
-        self._agent_reports = []
+        # %-style so the message is only formatted when INFO is enabled
+        self._logger.info("Starting full analysis workflow for: %.100s", user_request)
+        self._agent_reports.clear()
 
         workflow_result = {
             "user_request": user_request,
@@ -207,7 +285,9 @@ class OrchestratorAgent(BaseAgent):
         # =========================
         self._logger.info("Stage 1: Fetching logs from DataDog")
         logs = self.datadog_agent.fetch_logs(time_from=time_from, time_to=time_to)
-        services = self.datadog_agent.get_services(logs)
+        # One pass buckets logs by service; later stages format only their bucket
+        logs_by_service = self.datadog_agent.group_logs_by_service(logs)
+        services = sorted(logs_by_service)
 
         workflow_result["stages"]["datadog"] = {
             "logs_fetched": len(logs),
@@ -230,15 +310,18 @@ class OrchestratorAgent(BaseAgent):
         # Stage 2: Pre-analysis KB check (ServiceNow)
         # =========================
         self._logger.info("Stage 2: Pre-analysis KB check in ServiceNow")
+
+        # One bulk search covers every service; results come back bucketed per service
+        kb_by_service = self.servicenow_agent.search_incidents_bulk(
+            query=user_request,
+            service_names=services,
+            limit_per_service=5,
+            mode="knowledge",
+        )
+
         services_to_analyze = []
         for service in services:
-            kb_results = self.servicenow_agent.search_incidents(
-                query=user_request,
-                service_name=service,
-                mode="knowledge",
-                limit=5,
-            )
-
+            kb_results = kb_by_service.get(service)
             if kb_results:
                 workflow_result["tickets_created"].append(
                     {
@@ -266,87 +349,67 @@ class OrchestratorAgent(BaseAgent):
 
         # =========================
         # Stage 3: Analyze logs (Coding Agent)
-        # =========================
-        self._logger.info("Stage 3: Analyzing logs with Coding Agent")
-        analysis_results = {}
-        for service in services_to_analyze:
-            formatted_logs = self.datadog_agent.format_logs(logs, service=service)
-            analysis = self.coding_agent.full_analysis(formatted_logs, service_name=service)
-            analysis_results[service] = analysis
-
-            self._agent_reports.append(
-                {
-                    "agent": "Coding Agent",
-                    "action": f"Analyzed {service}",
-                    "result": f"Severity: {analysis['severity']['severity']}, "
-                    f"Issues: {len(analysis['patterns'].get('error_types', []))}",
-                }
-            )
-
-        workflow_result["stages"]["analysis"] = analysis_results
-
-        # =========================
         # Stage 4: Deduplicate & create tickets (ServiceNow Agent)
         # =========================
+        # Analysis is local CPU work on this thread. As soon as a service is
+        # analyzed, its ticket work (one search plus maybe one create) goes to
+        # the executor, so ServiceNow round-trips overlap the remaining analyses.
+        self._logger.info("Stage 3: Analyzing logs with Coding Agent")
         if create_tickets:
             self._logger.info("Stage 4: Deduplicating and creating ServiceNow tickets")
-            for service, analysis in analysis_results.items():
+        analysis_results = {}
+        # Each analysis's nested severity and error type count are read once
+        # for the reports, the ticket filter and the summary
+        severity_by_service: dict[str, str] = {}
+        error_type_counts: dict[str, int] = {}
+        ticket_futures = []
+        with self._service_executor(len(services_to_analyze)) as executor:
+            for service in services_to_analyze:
+                formatted_logs = self.datadog_agent.format_logs(logs_by_service[service])
+                analysis = self.coding_agent.full_analysis(formatted_logs, service_name=service)
                 severity = analysis.get("severity", {}).get("severity", "low")
-                if severity not in ("critical", "high", "medium"):
-                    continue  # skip low severity
-
-                # Search for active tickets to prevent duplicates
-                existing_tickets = self.servicenow_agent.search_incidents(
-                    query=user_request,
-                    service_name=service,
-                    mode="decision",
-                    limit=5,
+                error_type_count = len(analysis.get("patterns", {}).get("error_types", ()))
+                analysis_results[service] = analysis
+                severity_by_service[service] = severity
+                error_type_counts[service] = error_type_count
+
+                self._agent_reports.append(
+                    {
+                        "agent": "Coding Agent",
+                        "action": f"Analyzed {service}",
+                        "result": f"Severity: {severity}, Issues: {error_type_count}",
+                    }
                 )
 
-                if existing_tickets:
-                    workflow_result["tickets_created"].append(
-                        {
-                            "service": service,
-                            "ticket_number": [t.get("number") for t in existing_tickets],
-                            "priority": severity,
-                            "note": "Duplicate ticket exists — not creating a new one",
-                        }
-                    )
-                    self._agent_reports.append(
-                        {
-                            "agent": "ServiceNow Agent",
-                            "action": f"Duplicate check for {service}",
-                            "result": f"{len(existing_tickets)} active ticket(s) found",
-                        }
-                    )
-                else:
-                    formatted_logs = self.datadog_agent.format_logs(logs, service=service)
-                    ticket = self.servicenow_agent.create_ticket_from_analysis(
-                        service_name=service,
-                        analysis_report=analysis,
-                        user_input=user_request,
-                        log_context=formatted_logs,
+                if create_tickets and severity in _TICKET_SEVERITIES:
+                    ticket_futures.append(
+                        executor.submit(
+                            self._process_service_ticket,
+                            service,
+                            analysis,
+                            severity,
+                            user_request,
+                            formatted_logs,
+                        )
                     )
 
-                    workflow_result["tickets_created"].append(
-                        {
-                            "service": service,
-                            "ticket_number": ticket.get("number"),
-                            "priority": severity,
-                        }
-                    )
-                    self._agent_reports.append(
-                        {
-                            "agent": "ServiceNow Agent",
-                            "action": f"Created ticket for {service}",
-                            "result": f"Ticket: {ticket.get('number', 'N/A')}",
-                        }
-                    )
+            # Workers only return results; the shared lists are extended here
+            # in service order, so no lock is needed
+            outcomes = [future.result() for future in ticket_futures]
+
+        workflow_result["stages"]["analysis"] = analysis_results
+
+        if outcomes:
+            ticket_entries, reports = zip(*outcomes)
+            workflow_result["tickets_created"].extend(ticket_entries)
+            self._agent_reports.extend(reports)
 
         # =========================
         # Stage 5: Generate summary
         # =========================
-        workflow_result["summary"] = self._generate_workflow_summary(workflow_result)
+        workflow_result["summary"] = self._generate_workflow_summary(
+            workflow_result, severity_by_service, error_type_counts
+        )
 
         # =========================
         # Stage 6: Record orchestrator action
@@ -360,49 +423,175 @@ class OrchestratorAgent(BaseAgent):
 
         return workflow_result
 
-    def _generate_workflow_summary(self, workflow_result: dict) -> str:
+    async def aanalyze_and_report(
+        self,
+        user_request: str,
+        time_from: str = "now-1d",
+        time_to: str = "now",
+        create_tickets: bool = True,
+    ) -> dict:
+        """
+        Asynchronously run the complete analyze_and_report workflow.
+
+        The workflow runs in a worker thread, so the event loop stays free;
+        its per-service ServiceNow calls already run concurrently.
+
+        Args:
+            user_request: User's request or description of the issue.
+            time_from: Start time for log query.
+            time_to: End time for log query.
+            create_tickets: Whether to create ServiceNow tickets for new issues.
+
+        Returns:
+            Complete workflow result including analysis, tickets, and summary.
+        """
+        return await asyncio.to_thread(
+            self.analyze_and_report,
+            user_request,
+            time_from=time_from,
+            time_to=time_to,
+            create_tickets=create_tickets,
+        )
+
+    def _process_service_ticket(
+        self,
+        service: str,
+        analysis: dict,
+        severity: str,
+        user_request: str,
+        formatted_logs: str,
+    ) -> tuple[dict, dict]:
+        """
+        Check for a duplicate active ticket and create one if none exists.
+
+        Args:
+            service: Service the analysis belongs to.
+            analysis: Coding Agent analysis report for the service.
+            severity: Assessed severity of the service's issues.
+            user_request: User's request or description of the issue.
+            formatted_logs: The service's logs as formatted for analysis.
+
+        Returns:
+            Tuple of (ticket entry for the workflow result, agent report).
+        """
+        # Search for active tickets to prevent duplicates
+        existing_tickets = self.servicenow_agent.search_incidents(
+            query=user_request,
+            service_name=service,
+            mode="decision",
+            limit=5,
+        )
+
+        if existing_tickets:
+            return (
+                {
+                    "service": service,
+                    "ticket_number": [t.get("number") for t in existing_tickets],
+                    "priority": severity,
+                    "note": "Duplicate ticket exists — not creating a new one",
+                },
+                {
+                    "agent": "ServiceNow Agent",
+                    "action": f"Duplicate check for {service}",
+                    "result": f"{len(existing_tickets)} active ticket(s) found",
+                },
+            )
+
+        ticket = self.servicenow_agent.create_ticket_from_analysis(
+            service_name=service,
+            analysis_report=analysis,
+            user_input=user_request,
+            log_context=formatted_logs,
+        )
+
+        return (
+            {
+                "service": service,
+                "ticket_number": ticket.get("number"),
+                "priority": severity,
+            },
+            {
+                "agent": "ServiceNow Agent",
+                "action": f"Created ticket for {service}",
+                "result": f"Ticket: {ticket.get('number', 'N/A')}",
+            },
+        )
+
+    def _generate_workflow_summary(
+        self,
+        workflow_result: dict,
+        severity_by_service: dict[str, str],
+        error_type_counts: dict[str, int],
+    ) -> str:
         """Generate a natural language summary of the workflow."""
         stages = workflow_result.get("stages", {})
         tickets = workflow_result.get("tickets_created", [])
+        time_range = workflow_result["time_range"]
+        dd_stage = stages.get("datadog", {})
+        analysis = stages.get("analysis", {})
 
-        lines = [
-            "## AIOps Workflow Summary",
-            "",
-            f"**Time Range:** {workflow_result['time_range']['from']} to {workflow_result['time_range']['to']}",
-            "",
+        # Each section ends with a newline and sections are separated by a blank line
+        sections = [
+            f"{_SUMMARY_HEADER}"
+            f"**Time Range:** {time_range['from']} to {time_range['to']}\n"
+            "\n"
+            f"{_SECTION_LOG_COLLECTION}"
+            f"- Logs retrieved: {dd_stage.get('logs_fetched', 0)}\n"
+            f"- Services affected: {', '.join(dd_stage.get('services_found', _NO_SERVICES))}\n"
         ]
 
-        # DataDog summary
-        dd_stage = stages.get("datadog", {})
-        lines.append("### Log Collection")
-        lines.append(f"- Logs retrieved: {dd_stage.get('logs_fetched', 0)}")
-        lines.append(f"- Services affected: {', '.join(dd_stage.get('services_found', ['None']))}")
-        lines.append("")
-
-        # Analysis summary
-        analysis = stages.get("analysis", {})
         if analysis:
-            lines.append("### Analysis Results")
-            for service, result in analysis.items():
-                severity = result.get("severity", {}).get("severity", "unknown")
-                error_count = len(result.get("patterns", {}).get("error_types", []))
-                lines.append(
-                    f"- **{service}**: {severity.upper()} severity, {error_count} error types"
+            sections.append(
+                _SECTION_ANALYSIS
+                + "".join(
+                    f"- **{service}**: "
+                    f"{severity_by_service.get(service, 'unknown').upper()} severity, "
+                    f"{error_type_counts.get(service, 0)} error types\n"
+                    for service in analysis
                 )
-            lines.append("")
+            )
 
-        # Tickets summary
         if tickets:
-            lines.append("### Tickets Created")
-            for ticket in tickets:
-                lines.append(
-                    f"- {ticket['ticket_number']}: [{ticket['priority'].upper()}] {ticket['service']}"
-                )
+            ticket_lines = "\n".join(
+                f"- {ticket['ticket_number']}: [{ticket['priority'].upper()}] {ticket['service']}"
+                for ticket in tickets
+            )
         else:
-            lines.append("### Tickets Created")
-            lines.append("- No tickets created")
+            ticket_lines = "- No tickets created"
+        sections.append(f"{_SECTION_TICKETS}{ticket_lines}")
+
+        return "\n".join(sections)
 
-        return "\n".join(lines)
+    def iter_report(self) -> Iterator[str]:
+        """
+        Generate the activity report incrementally.
+
+        Yields the header, one chunk per agent report, then the orchestrator's
+        own actions, so callers can stream the report instead of holding it
+        in memory.
+
+        Yields:
+            Consecutive chunks of the report text.
+        """
+        yield (
+            "# AIOps Multi-Agent Activity Report\n"
+            "\n"
+            f"**Orchestrator ID:** {self.agent_id}\n"
+            f"**Total Actions:** {self._state.total_invocations}\n"
+            "\n"
+            "## Agent Actions\n"
+            "\n"
+        )
+
+        for report in self._agent_reports:
+            yield (
+                f"### {report['agent']}\n"
+                f"- **Action:** {report['action']}\n"
+                f"- **Result:** {report['result']}\n"
+                "\n"
+            )
+
+        yield f"## Orchestrator Actions\n{self.get_action_summary()}"
 
     def generate_report(self) -> str:
         """
@@ -411,28 +600,46 @@ class OrchestratorAgent(BaseAgent):
         Returns:
             Natural language report of all actions taken.
         """
-        lines = [
-            "# AIOps Multi-Agent Activity Report",
-            "",
-            f"**Orchestrator ID:** {self.agent_id}",
-            f"**Total Actions:** {self._state.total_invocations}",
-            "",
-            "## Agent Actions",
-            "",
-        ]
+        return "".join(self.iter_report())
 
-        # Add reports from each agent
-        for report in self._agent_reports:
-            lines.append(f"### {report['agent']}")
-            lines.append(f"- **Action:** {report['action']}")
-            lines.append(f"- **Result:** {report['result']}")
-            lines.append("")
+    def iter_all_agent_actions(self) -> Iterator[dict]:
+        """
+        Iterate over actions from all agents in timestamp order.
 
-        # Add orchestrator's own actions
-        lines.append("## Orchestrator Actions")
-        lines.append(self.get_action_summary())
+        Actions are merged lazily, so callers that stream or only need the
+        first few actions do not pay for the full list. Each history is
+        snapshotted when this is called, so later actions are not included.
 
-        return "\n".join(lines)
+        Returns:
+            Iterator over agent actions with agent attribution.
+        """
+        # Agents that were never loaded or have no history contribute nothing
+        sources = [
+            (name, agent)
+            for name, agent in (
+                ("Orchestrator", self),
+                ("DataDog", self._datadog_agent),
+                ("Coding", self._coding_agent),
+                ("ServiceNow", self._servicenow_agent),
+            )
+            if agent and agent.action_history
+        ]
+
+        # Snapshot each history: concurrent workflow stages keep appending while
+        # the merge is consumed, and an action stamped before a slower sibling's
+        # can be appended after it. Sorting the nearly ordered snapshot is close
+        # to linear, and a k-way merge then replaces sorting everything at once.
+        # The merge compares the actions' own timestamps; an action is
+        # serialized only once it is yielded.
+        by_time = attrgetter("timestamp")
+        merged = heapq.merge(
+            *(
+                zip(repeat(name), sorted(agent.action_history, key=by_time))
+                for name, agent in sources
+            ),
+            key=lambda pair: pair[1].timestamp,
+        )
+        return ({"agent": name, **action.to_dict()} for name, action in merged)
 
     def get_all_agent_actions(self) -> list[dict]:
         """
@@ -441,56 +648,12 @@ class OrchestratorAgent(BaseAgent):
         Returns:
             List of all agent actions with agent attribution.
         """
-        all_actions = []
-
-        # Orchestrator actions
-        for action in self.action_history:
-            all_actions.append(
-                {
-                    "agent": "Orchestrator",
-                    **action.model_dump(),
-                }
-            )
-
-        # DataDog agent actions
-        if self._datadog_agent:
-            for action in self._datadog_agent.action_history:
-                all_actions.append(
-                    {
-                        "agent": "DataDog",
-                        **action.model_dump(),
-                    }
-                )
-
-        # Coding agent actions
-        if self._coding_agent:
-            for action in self._coding_agent.action_history:
-                all_actions.append(
-                    {
-                        "agent": "Coding",
-                        **action.model_dump(),
-                    }
-                )
-
-        # ServiceNow agent actions
-        if self._servicenow_agent:
-            for action in self._servicenow_agent.action_history:
-                all_actions.append(
-                    {
-                        "agent": "ServiceNow",
-                        **action.model_dump(),
-                    }
-                )
-
-        # Sort by timestamp
-        all_actions.sort(key=lambda x: x.get("timestamp", ""))
-
-        return all_actions
+        return list(self.iter_all_agent_actions())
 
     def reset_all_agents(self) -> None:
         """Reset state for all agents."""
         self.reset_state()
-        self._agent_reports = []
+        self._agent_reports.clear()
 
         if self._datadog_agent:
             self._datadog_agent.reset_state()
@@ -5,6 +5,8 @@ Specialist agent for storing analysis reports to Amazon S3.
 Can be used standalone or as part of the multi-agent system.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 from ..tools.s3_tools import (
     S3Client,
     upload_service_report,
@@ -12,6 +14,9 @@ from ..tools.s3_tools import (
 )
 from .base import BaseAgent
 
+# Upper bound on concurrent PUTs in upload_reports_bulk
+_MAX_UPLOAD_WORKERS = 32
+
 
 class S3Agent(BaseAgent):
     """
@@ -77,7 +82,7 @@ class S3Agent(BaseAgent):
     def upload_report(
         self,
         service_name: str,
-        content: str,
+        content: str | bytes,
         timestamp: str | None = None,
     ) -> dict:
         """
@@ -88,13 +93,13 @@ class S3Agent(BaseAgent):
 
         Args:
             service_name: Name of the service.
-            content: Markdown content of the report.
+            content: Markdown content of the report (str or UTF-8 bytes).
             timestamp: Optional timestamp for the filename.
 
         Returns:
             Dictionary with upload result.
         """
-        self._logger.info(f"Uploading report for service: {service_name}")
+        self._logger.info("Uploading report for service: %s", service_name)
 
         result = self._s3_client.upload_report(service_name, content, timestamp)
 
@@ -109,9 +114,48 @@ class S3Agent(BaseAgent):
 
         return result
 
+    def upload_reports_bulk(
+        self,
+        items: list[tuple[str, str | bytes, str | None]],
+    ) -> list[dict]:
+        """
+        Upload several service reports to S3 concurrently.
+
+        The PUTs are independent network calls, so they run on a small thread
+        pool sharing one S3 client. A single action is recorded for the batch.
+
+        Args:
+            items: (service_name, content, timestamp) tuples; timestamp may be None.
+
+        Returns:
+            Upload results in the same order as items.
+        """
+        if not items:
+            return []
+
+        self._logger.info("Uploading %d service reports", len(items))
+
+        with ThreadPoolExecutor(max_workers=min(_MAX_UPLOAD_WORKERS, len(items))) as executor:
+            results = list(
+                executor.map(lambda item: self._s3_client.upload_report(*item), items)
+            )
+
+        failures = [r.get("error", "Unknown") for r in results if not r.get("success", False)]
+
+        self.record_action(
+            action_type="upload_reports_bulk",
+            description=f"Uploaded {len(items) - len(failures)}/{len(items)} service reports",
+            input_summary=lambda: f"Services: {[item[0] for item in items]}",
+            output_summary=f"{len(failures)} failed" if failures else "All uploads succeeded",
+            success=not failures,
+            error_message="; ".join(failures),
+        )
+
+        return results
+
     def upload_summary(
         self,
-        content: str,
+        content: str | bytes,
         timestamp: str | None = None,
     ) -> dict:
         """
@@ -121,7 +165,7 @@ class S3Agent(BaseAgent):
         LLM reasoning, just direct upload.
 
         Args:
-            content: Markdown content of the summary.
+            content: Markdown content of the summary (str or UTF-8 bytes).
             timestamp: Optional timestamp for the filename.
 
         Returns:
@@ -5,6 +5,12 @@ Specialist agent for managing ServiceNow incidents.
 Can be used standalone or as part of the multi-agent swarm.
 """
 
+import functools
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future
+
 from ..tools.servicenow_tools import (
     ServiceNowClient,
     create_incident,
@@ -12,8 +18,94 @@ from ..tools.servicenow_tools import (
     search_incidents,
     update_incident,
 )
+from ..utils.config_loader import load_tools_config
 from .base import BaseAgent
 
+# Log context kept in an automated ticket description
+_TICKET_LOG_CONTEXT_MAX = 2000
+_TRUNCATED_MARKER = "\n... [truncated]"
+
+# Short-lived caches of ServiceNow reads, shared by all agents. Duplicate
+# checks and status polls repeat the same request within seconds.
+# key -> (monotonic expiry, result); insertion order doubles as age order.
+_READ_CACHE_MAX = 512
+_search_cache: dict[tuple, tuple[float, list[dict]]] = {}
+_status_cache: dict[tuple, tuple[float, dict]] = {}
+_read_cache_lock = threading.Lock()
+
+
+def _get_cached(cache: dict, key: tuple):
+    """Return the cached result for a key, or None if missing or expired."""
+    with _read_cache_lock:
+        entry = cache.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del cache[key]
+            return None
+        return entry[1]
+
+
+def _cache_result(cache: dict, key: tuple, result, ttl: float) -> None:
+    """Cache a result for a key for ttl seconds."""
+    with _read_cache_lock:
+        cache.pop(key, None)
+        cache[key] = (time.monotonic() + ttl, result)
+        while len(cache) > _READ_CACHE_MAX:
+            del cache[next(iter(cache))]
+
+
+def _invalidate_reads(status_key: tuple | None = None) -> None:
+    """Drop cached searches (and one cached status) after a ticket write."""
+    with _read_cache_lock:
+        _search_cache.clear()
+        if status_key is not None:
+            _status_cache.pop(status_key, None)
+
+
+def clear_servicenow_cache() -> None:
+    """Clear the shared ServiceNow search and ticket status caches."""
+    with _read_cache_lock:
+        _search_cache.clear()
+        _status_cache.clear()
+
+
+@functools.lru_cache(maxsize=256)
+def _incident_filter(query: str, category_filter: str, state: str | None, mode: str) -> str:
+    """Build the sysparm_query filter for an incident search.
+
+    Cached because a workflow repeats the same request text and service
+    filters across its duplicate checks and across runs.
+    """
+    filters = []
+    if query:
+        filters.append(f"short_descriptionLIKE{query}")
+    if category_filter:
+        filters.append(category_filter)
+    if state:
+        filters.append(f"state={state}")
+    else:
+        if mode == "knowledge":
+            filters.append("stateIN6,7")  # Resolved, Closed
+        elif mode == "decision":
+            filters.append("stateIN1,2,3,4,5")  # Active states
+
+    return "^".join(filters)
+
+
+def _standardize_incident(r: dict) -> dict:
+    """Map a raw incident search result to the agent's incident shape."""
+    return {
+        "sys_id": r.get("sys_id"),
+        "number": r.get("number"),
+        "state": r.get("state"),
+        "priority": r.get("priority"),
+        "short_description": r.get("short_description"),
+        "assigned_to": r.get("assigned_to", {}).get("display_value", "Unassigned"),
+        "created_on": r.get("sys_created_on"),
+        "updated_on": r.get("sys_updated_on"),
+    }
+
 
 class ServiceNowAgent(BaseAgent):
     """
@@ -70,6 +162,14 @@ class ServiceNowAgent(BaseAgent):
             password=password,
         )
 
+        # Seconds a search or status result is reused (0 disables caching)
+        search_config = load_tools_config().get("servicenow", {}).get("search", {})
+        self._cache_ttl = search_config.get("cache_ttl_seconds", 30)
+
+        # Reads queued with batch=True: (sub-request, its Future, response -> result)
+        self._pending_batch: list[tuple[dict, Future, Callable[[dict], object]]] = []
+        self._batch_lock = threading.Lock()
+
         super().__init__(
             agent_type="servicenow",
             model_id=model_id,
@@ -124,6 +224,10 @@ class ServiceNowAgent(BaseAgent):
         success = "error" not in result
         ticket_number = result.get("number", "N/A")
 
+        if success:
+            # A new ticket can change any cached duplicate check
+            _invalidate_reads()
+
         self.record_action(
             action_type="create_ticket",
             description=f"Created ticket {ticket_number}" if success else "Failed to create ticket",
@@ -180,6 +284,9 @@ class ServiceNowAgent(BaseAgent):
 
         success = "error" not in result
 
+        if success:
+            _invalidate_reads((self._servicenow_client.base_url, ticket_id))
+
         self.record_action(
             action_type="update_ticket",
             description=f"Updated ticket {ticket_id}" if success else "Failed to update ticket",
@@ -193,22 +300,43 @@ class ServiceNowAgent(BaseAgent):
 
         return result
 
-    def get_ticket_status(self, ticket_id: str) -> dict:
+    def get_ticket_status(self, ticket_id: str, batch: bool = False) -> dict | Future:
         """
         Get the current status of a ticket.
 
         Args:
             ticket_id: The sys_id of the ticket.
+            batch: Queue the read for the next flush_batch() instead of
+                  sending it now.
 
         Returns:
-            Dictionary with ticket status details.
+            Dictionary with ticket status details, or with batch=True a Future
+            resolving to it once flush_batch() runs.
         """
         self._logger.info(f"Getting status for ticket: {ticket_id}")
 
-        result = self._servicenow_client.get_incident(ticket_id)
+        cache_key = (self._servicenow_client.base_url, ticket_id)
+        cached = _get_cached(_status_cache, cache_key) if self._cache_ttl > 0 else None
+
+        if batch:
+            if cached is not None:
+                future: Future = Future()
+                future.set_result(dict(cached))
+                return future
+            return self._queue_batch(
+                {"method": "GET", "url": self._servicenow_client.incident_path(ticket_id)},
+                lambda response: self._finish_status(cache_key, response.get("result", response)),
+            )
+
+        if cached is not None:
+            return dict(cached)
 
+        return self._finish_status(cache_key, self._servicenow_client.get_incident(ticket_id))
+
+    def _finish_status(self, cache_key: tuple, result: dict) -> dict:
+        """Shape (and cache) a raw incident read as a ticket status."""
         if "error" not in result:
-            return {
+            status = {
                 "sys_id": result.get("sys_id"),
                 "number": result.get("number"),
                 "state": result.get("state"),
@@ -218,6 +346,9 @@ class ServiceNowAgent(BaseAgent):
                 "created_on": result.get("sys_created_on"),
                 "updated_on": result.get("sys_updated_on"),
             }
+            if self._cache_ttl > 0:
+                _cache_result(_status_cache, cache_key, status, self._cache_ttl)
+            return dict(status)
 
         return result
 
@@ -254,11 +385,9 @@ class ServiceNowAgent(BaseAgent):
         if len(error_types) > 2:
             short_desc += f" (+{len(error_types) - 2} more)"
 
-        # Build full description
-        description_parts = []
-
-        if user_input:
-            description_parts.append(f"## User Report\n{user_input}")
+        # Build full description; every section and suggestion line is
+        # separated by a blank line
+        description_parts = [f"## User Report\n{user_input}"] if user_input else []
 
         description_parts.append(
             f"## AI Analysis Summary\n{analysis_report.get('summary', 'No summary available')}"
@@ -266,18 +395,21 @@ class ServiceNowAgent(BaseAgent):
 
         if suggestions:
             description_parts.append("\n## Suggested Fixes")
-            for i, suggestion in enumerate(suggestions[:3], 1):
-                description_parts.append(
-                    f"{i}. **{suggestion.get('error_type', 'Issue')}**: "
-                    f"{suggestion.get('suggestion', 'Review and fix')}"
-                )
+            description_parts.extend(
+                f"{i}. **{suggestion.get('error_type', 'Issue')}**: "
+                f"{suggestion.get('suggestion', 'Review and fix')}"
+                for i, suggestion in enumerate(suggestions[:3], 1)
+            )
 
         if log_context:
             # Truncate log context to avoid overly long tickets
-            truncated_logs = log_context[:2000]
-            if len(log_context) > 2000:
-                truncated_logs += "\n... [truncated]"
-            description_parts.append(f"\n## Relevant Logs\n```\n{truncated_logs}\n```")
+            truncated_tail = (
+                _TRUNCATED_MARKER if len(log_context) > _TICKET_LOG_CONTEXT_MAX else ""
+            )
+            description_parts.append(
+                f"\n## Relevant Logs\n```\n"
+                f"{log_context[:_TICKET_LOG_CONTEXT_MAX]}{truncated_tail}\n```"
+            )
 
         description = "\n\n".join(description_parts)
 
@@ -329,7 +461,8 @@ Use the create_incident tool to create the ticket."""
         state: str | None = None,
         limit: int = 5,
         mode: str = "knowledge",
-    ) -> list[dict]:
+        batch: bool = False,
+    ) -> list[dict] | Future:
         """
         Search for ServiceNow incidents programmatically.
 
@@ -343,6 +476,8 @@ Use the create_incident tool to create the ticket."""
             limit: Maximum number of results to return. Defaults to 5.
             mode: 'knowledge' for resolved/closed incidents,
                 'decision' for active tickets (to prevent duplicates).
+            batch: Queue the search for the next flush_batch() instead of
+                  sending it now.
 
         Returns:
             List of dictionaries with incident details:
@@ -355,64 +490,242 @@ Use the create_incident tool to create the ticket."""
             - created_on
             - updated_on
 
-            Returns empty list if no matches or on error.
+            Returns empty list if no matches or on error. With batch=True,
+            a Future resolving to that list once flush_batch() runs.
         """
         self._logger.info(f"Searching ServiceNow tickets (mode={mode}) with query: {query[:100]}")
 
-        # Build ServiceNow query string
-        filters = []
-        if query:
-            filters.append(f"short_descriptionLIKE{query}")
-        if service_name:
-            filters.append(f"category={service_name}")
-        if state:
-            filters.append(f"state={state}")
-        else:
-            if mode == "knowledge":
-                filters.append("stateIN6,7")  # Resolved, Closed
-            elif mode == "decision":
-                filters.append("stateIN1,2,3,4,5")  # Active states
+        category_filter = f"category={service_name}" if service_name else ""
+        sysparm_query = _incident_filter(query, category_filter, state, mode)
+        input_summary = (
+            f"Query: {query[:100]}, Service: {service_name}, State: {state}, Limit: {limit}"
+        )
+
+        # Decision searches guard against duplicate tickets, which may be created
+        # by the create_incident tool or another container, so they always go out
+        cache_key = None
+        if self._cache_ttl > 0 and mode != "decision":
+            cache_key = (self._servicenow_client.base_url, mode, sysparm_query, limit)
+        cached = _get_cached(_search_cache, cache_key) if cache_key is not None else None
 
-        sysparm_query = "^".join(filters)
+        if cached is not None:
+            self.record_action(
+                action_type="search_tickets",
+                description=f"Performed ServiceNow search ({mode})",
+                input_summary=input_summary,
+                output_summary=f"Found {len(cached)} matching tickets (cached)",
+                success=True,
+            )
+            if batch:
+                future: Future = Future()
+                future.set_result(list(cached))
+                return future
+            return list(cached)
+
+        client = self._servicenow_client
+
+        if batch:
+            params = client.search_params(raw_query=sysparm_query, limit=limit)
+            return self._queue_batch(
+                {"method": "GET", "url": client.incident_path(params=params)},
+                lambda response: self._complete_search(
+                    cache_key,
+                    [response]
+                    if "error" in response
+                    else client.shape_search_results(response.get("result", [])),
+                    mode,
+                    input_summary,
+                ),
+            )
 
         try:
-            results_raw = self._servicenow_client.search_incidents(text=sysparm_query, limit=limit)
+            results_raw = client.search_incidents(raw_query=sysparm_query, limit=limit)
+        except Exception as e:
+            return self._search_failed(input_summary, e)
+
+        return self._complete_search(cache_key, results_raw, mode, input_summary)
 
+    def _complete_search(
+        self,
+        cache_key: tuple | None,
+        results_raw: list[dict],
+        mode: str,
+        input_summary: str,
+    ) -> list[dict]:
+        """
+        Standardize, cache and record the raw results of an incident search.
+
+        Results are only cached when cache_key is given.
+        """
+        try:
             # Standardize output
-            results = []
-            for r in results_raw:
-                results.append(
-                    {
-                        "sys_id": r.get("sys_id"),
-                        "number": r.get("number"),
-                        "state": r.get("state"),
-                        "priority": r.get("priority"),
-                        "short_description": r.get("short_description"),
-                        "assigned_to": r.get("assigned_to", {}).get("display_value", "Unassigned"),
-                        "created_on": r.get("sys_created_on"),
-                        "updated_on": r.get("sys_updated_on"),
-                    }
-                )
+            results = [_standardize_incident(r) for r in results_raw]
+
+            # Failed searches come back as error entries; only cache real results
+            if cache_key is not None and not any("error" in r for r in results_raw):
+                _cache_result(_search_cache, cache_key, results, self._cache_ttl)
 
             # Record the search action
             self.record_action(
                 action_type="search_tickets",
                 description=f"Performed ServiceNow search ({mode})",
-                input_summary=f"Query: {query[:100]}, Service: {service_name}, State: {state}, Limit: {limit}",
+                input_summary=input_summary,
                 output_summary=f"Found {len(results)} matching tickets",
                 success=True,
             )
 
-            return results
+            return list(results)
 
         except Exception as e:
-            self._logger.error(f"ServiceNow search failed: {e}")
+            return self._search_failed(input_summary, e)
+
+    def _search_failed(self, input_summary: str, error: Exception) -> list[dict]:
+        """Record a failed incident search and return no results."""
+        self._logger.error(f"ServiceNow search failed: {error}")
+        self.record_action(
+            action_type="search_tickets",
+            description="ServiceNow search failed",
+            input_summary=input_summary,
+            output_summary=str(error),
+            success=False,
+            error_message=str(error),
+        )
+        return []
+
+    def search_incidents_bulk(
+        self,
+        query: str = "",
+        service_names: list[str] | None = None,
+        limit_per_service: int = 5,
+        mode: str = "knowledge",
+    ) -> dict[str, list[dict]]:
+        """
+        Search incidents for several services with as few ServiceNow requests as possible.
+
+        Filters on all services at once (category IN ...) and buckets the
+        results per service, keeping the most recently updated matches. When a
+        full page leaves some buckets short (one busy service crowding out the
+        rest), the search is repeated for just those services, so every full
+        page fills at least one bucket and at most one request per service is sent.
+
+        Args:
+            query: Free-text search query (e.g., issue description or keywords).
+            service_names: Service names to search (each maps to a category).
+            limit_per_service: Maximum number of results kept per service.
+            mode: 'knowledge' for resolved/closed incidents,
+                'decision' for active tickets.
+
+        Returns:
+            Dictionary mapping each service name to its matching incidents
+            (same shape as search_incidents). Services with no matches, or all
+            services on error, map to an empty list.
+        """
+        service_names = service_names or []
+        by_service: dict[str, list[dict]] = {service: [] for service in service_names}
+        if not service_names:
+            return by_service
+
+        self._logger.info(
+            f"Bulk searching ServiceNow tickets (mode={mode}) for {len(service_names)} services"
+        )
+
+        try:
+            matched = 0
+            seen: set[str] = set()
+            pending = list(service_names)
+
+            while pending:
+                page_size = limit_per_service * len(pending)
+                sysparm_query = _incident_filter(
+                    query, f"categoryIN{','.join(pending)}", None, mode
+                )
+                results_raw = self._servicenow_client.search_incidents(
+                    raw_query=sysparm_query, limit=page_size
+                )
+
+                for r in results_raw:
+                    bucket = by_service.get(r.get("category"))
+                    # Re-searched services return their earlier matches first
+                    key = r.get("sys_id") or r.get("number")
+                    if bucket is None or len(bucket) >= limit_per_service or key in seen:
+                        continue
+                    seen.add(key)
+                    bucket.append(_standardize_incident(r))
+                    matched += 1
+
+                # A short page means every pending service got all of its matches
+                if len(results_raw) < page_size:
+                    break
+
+                unfilled = [s for s in pending if len(by_service[s]) < limit_per_service]
+                if len(unfilled) == len(pending):
+                    break
+                pending = unfilled
+
             self.record_action(
                 action_type="search_tickets",
-                description="ServiceNow search failed",
-                input_summary=f"Query: {query[:100]}, Service: {service_name}, State: {state}, Limit: {limit}",
+                description=f"Performed bulk ServiceNow search ({mode})",
+                input_summary=f"Query: {query[:100]}, Services: {len(service_names)}, "
+                f"Limit per service: {limit_per_service}",
+                output_summary=f"Found {matched} matching tickets",
+                success=True,
+            )
+
+        except Exception as e:
+            self._logger.error(f"ServiceNow bulk search failed: {e}")
+            self.record_action(
+                action_type="search_tickets",
+                description="ServiceNow bulk search failed",
+                input_summary=f"Query: {query[:100]}, Services: {len(service_names)}",
                 output_summary=str(e),
                 success=False,
                 error_message=str(e),
             )
-            return []
+
+        return by_service
+
+    # ==========================================
+    # Batched Reads
+    # ==========================================
+
+    def _queue_batch(self, request: dict, finish: Callable[[dict], object]) -> Future:
+        """Queue a Batch API sub-request; finish turns its response into the Future's result."""
+        future: Future = Future()
+        with self._batch_lock:
+            self._pending_batch.append((request, future, finish))
+        return future
+
+    def flush_batch(self) -> int:
+        """
+        Send every read queued with batch=True in one ServiceNow Batch API call.
+
+        Resolves the Futures returned by search_incidents(batch=True) and
+        get_ticket_status(batch=True).
+
+        Returns:
+            Number of requests sent.
+        """
+        with self._batch_lock:
+            pending, self._pending_batch = self._pending_batch, []
+
+        if not pending:
+            return 0
+
+        self._logger.info(f"Flushing {len(pending)} batched ServiceNow requests")
+
+        responses = self._servicenow_client.batch([request for request, _, _ in pending])
+        for (_, future, finish), response in zip(pending, responses):
+            try:
+                future.set_result(finish(response))
+            except Exception as e:
+                future.set_exception(e)
+
+        failed = sum("error" in response for response in responses)
+        self.record_action(
+            action_type="flush_batch",
+            description=f"Sent {len(pending)} ServiceNow requests in one batch",
+            output_summary=f"{len(pending) - failed} succeeded, {failed} failed",
+            success=failed == 0,
+        )
+
+        return len(pending)
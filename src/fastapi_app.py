@@ -2,15 +2,20 @@
 Primary FastAPI Application to invoke AWS AgentCore Application deployed on AWS.
 """
 
-import json
+import asyncio
 import os
+from collections.abc import Iterator
+from contextlib import asynccontextmanager
 
 import boto3
 import uvicorn
+from botocore.config import Config
 from dotenv import load_dotenv
-from fastapi import FastAPI, Request, Response
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 
+from utils import json_utils
 from utils.env_bootstrap import bootstrap_env_from_json
 
 bootstrap_env_from_json(
@@ -29,11 +34,33 @@ CORS_HEADERS = {
     "Access-Control-Allow-Methods": "OPTIONS,POST,GET",
 }
 PORT = 8000
+# Bytes read from the AgentCore response per streamed chunk
+STREAM_CHUNK_SIZE = 8192
 AWS_REGION = os.environ.get("AWS_DEFAULT_REGION")
 AGENTCORE_AGENT_RUNTIME_ARN = os.environ.get(
     "AGENTCORE_AGENT_RUNTIME_ARN"
 )  # Get from AgentCore UI on AWS.
-app = FastAPI()
+
+# One bedrock-agentcore client serves every request (boto3 clients are
+# thread-safe); its pool covers concurrent invocations
+AGENTCORE_CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    retries={"max_attempts": 3, "mode": "adaptive"},
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create the shared AgentCore client once per process."""
+    app.state.agentcore_client = boto3.client(
+        "bedrock-agentcore",
+        region_name=AWS_REGION,
+        config=AGENTCORE_CLIENT_CONFIG,
+    )
+    yield
+
+
+app = FastAPI(lifespan=lifespan)
 
 # Setting up middleware
 app.add_middleware(
@@ -44,29 +71,44 @@ app.add_middleware(
 )
 
 
-@app.post("/invoke")
-async def invoke_agent(request: Request):
-    """
-    Invoke Agent on AWS AgentCore using boto3 client.
-    """
-    body = await request.json()
-
-    client = boto3.client(
-        "bedrock-agentcore",
-        region_name=AWS_REGION,
-    )
-
+def _call_agentcore(client, payload: bytes):
+    """Invoke the AgentCore runtime and return its response body stream (blocking)."""
     response = client.invoke_agent_runtime(
         agentRuntimeArn=AGENTCORE_AGENT_RUNTIME_ARN,
         contentType="application/json",
         accept="application/json",
-        payload=json.dumps(body).encode("utf-8"),
+        payload=payload,
     )
 
-    result = response["response"].read().decode("utf-8")
+    return response["response"]
+
+
+def _iter_body(body) -> Iterator[bytes]:
+    """Yield an AgentCore response body in chunks, closing it when done."""
+    try:
+        yield from body.iter_chunks(STREAM_CHUNK_SIZE)
+    finally:
+        body.close()
+
+
+@app.post("/invoke")
+async def invoke_agent(request: Request):
+    """
+    Invoke Agent on AWS AgentCore using boto3 client.
+    """
+    # The body is parsed only to reject invalid JSON; the original bytes are
+    # forwarded as the payload instead of being re-serialized
+    payload = await request.body()
+    json_utils.loads(payload)
+
+    # boto3 blocks, so the call runs in a worker thread and other requests
+    # keep being served while the agent works
+    body = await asyncio.to_thread(_call_agentcore, request.app.state.agentcore_client, payload)
 
-    return Response(
-        content=result,
+    # Relay the response as it arrives instead of buffering it; Starlette
+    # reads the blocking iterator in its thread pool
+    return StreamingResponse(
+        _iter_body(body),
         status_code=200,
         headers=CORS_HEADERS,
         media_type="application/json",
@@ -5,30 +5,68 @@ AgentCore Runtime wrapper for the AIOps Proactive Workflow.
 Manages scaling, invocations, and health checks automatically.
 """
 
-import json
+import logging
+import os
 import sys
 import threading
+import time
 import traceback
 import uuid
-from pathlib import Path
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 
 from bedrock_agentcore import BedrockAgentCoreApp
 from dotenv import load_dotenv
 from starlette.middleware import Middleware
 from starlette.middleware.cors import CORSMiddleware
 
-PROJECT_ROOT = Path(__file__).parent.parent
-sys.path.insert(0, str(PROJECT_ROOT))
-
+# Run as a module (python -m src.main) or with the project root on
+# PYTHONPATH (see Dockerfile) so `src` is importable without path hacks.
 load_dotenv()
 
-from src.agents import OrchestratorAgent
+from src.utils import json_utils
+from src.utils.config_loader import get_agent_config, load_settings
 from src.utils.logging_config import get_logger, setup_logging
-from src.workflows import AIOpsSwarm, run_proactive_workflow
+
+# Agents and workflows pull in the Strands/Bedrock/boto3 graph, so they are
+# imported on first use rather than at server start.
+if TYPE_CHECKING:
+    from src.agents import OrchestratorAgent
+    from src.workflows import AIOpsSwarm
 
 setup_logging()
 logger = get_logger("main")
 
+# Scheduled EventBridge rules deliver the raw event when no Input is set
+_EVENTBRIDGE_SOURCES = frozenset({"aws.events"})
+
+# Warm agent pool: reuse fully-built agents across invocations instead of
+# rebuilding the Bedrock model, Strands Agent and tool registry every request.
+_AGENT_POOL_MAX = int(os.environ.get("AGENT_POOL_MAX", "16"))
+_AGENT_POOL_IDLE_S = int(os.environ.get("AGENT_POOL_IDLE_S", "900"))
+# How long a chat turn waits for its session's busy orchestrator before
+# running on a fresh one
+_SESSION_CHECKOUT_WAIT_S = float(os.environ.get("SESSION_CHECKOUT_WAIT_S", "30"))
+
+# key -> (last_used monotonic timestamp, instance, in-use lock), kept in LRU order.
+# The in-use lock gives one invocation at a time exclusive use of an instance.
+_agent_pool: OrderedDict[tuple, tuple[float, Any, threading.Lock]] = OrderedDict()
+_agent_pool_lock = threading.Lock()
+# key -> lock held while that key's instance is being built
+_agent_pool_build_locks: dict[tuple, threading.Lock] = {}
+
+_SWARM_AGENT_TYPES = ("datadog", "coding", "servicenow", "s3")
+
+# Fixed validation error responses, built once and read-only. Handlers
+# return a copy, so annotating a response never changes the template.
+_ERR_MISSING_MESSAGE = MappingProxyType(
+    {"success": False, "error": "Missing 'message' in payload"}
+)
+_ERR_MISSING_TASK = MappingProxyType({"success": False, "error": "Missing 'task' in payload"})
+
 # Initialize AgentCore app with CORS middleware
 app = BedrockAgentCoreApp(
     middleware=[
@@ -62,23 +100,27 @@ def invoke(payload: dict) -> dict:
     Returns:
         Workflow result dictionary.
     """
-    logger.info(f"AgentCore invoked: {json.dumps(payload)[:200]}...")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("AgentCore invoked: %s...", json_utils.dumps(payload)[:200])
+
+    # Scheduled triggers always run the proactive workflow. Payload values are
+    # arbitrary JSON, so only a string source can be looked up in the set.
+    source = payload.get("source")
+    if isinstance(source, str) and source in _EVENTBRIDGE_SOURCES:
+        mode = "proactive"
+    else:
+        mode = payload.get("mode", "proactive")
 
-    mode = payload.get("mode", "proactive")
+    handler = _MODE_HANDLERS.get(mode) if isinstance(mode, str) else None
+    if handler is None:
+        return {
+            "success": False,
+            "error": f"Unknown mode: {mode}",
+            "supported_modes": _SUPPORTED_MODES,
+        }
 
     try:
-        if mode == "proactive":
-            return handle_proactive(payload)
-        elif mode == "chat":
-            return handle_chat(payload)
-        elif mode == "swarm":
-            return handle_swarm(payload)
-        else:
-            return {
-                "success": False,
-                "error": f"Unknown mode: {mode}",
-                "supported_modes": ["proactive", "chat", "swarm"],
-            }
+        return handler(payload)
 
     except Exception as e:
         logger.error(f"Invocation failed: {e}")
@@ -89,6 +131,228 @@ def invoke(payload: dict) -> dict:
         }
 
 
+def _agent_pool_key(agent_type: str, *extra: Any) -> tuple:
+    """
+    Build a pool key from the resolved agent configuration.
+
+    Mirrors the model/region resolution in BaseAgent.__init__ so that a
+    config change produces a new key instead of returning a stale agent.
+    """
+    model_id = get_agent_config(agent_type).get("model_id")
+    region = load_settings().get("aws", {}).get("region", "us-east-1")
+    return (agent_type, model_id, region, *extra)
+
+
+def _pool_lookup(key: tuple) -> tuple[Any, threading.Lock] | None:
+    """
+    Return the pooled (instance, in-use lock) for key, dropping idle entries.
+
+    Caller holds the pool lock.
+    """
+    now = time.monotonic()
+
+    # LRU order means idle entries are always at the front
+    while _agent_pool:
+        oldest_key, (last_used, _, _) = next(iter(_agent_pool.items()))
+        if now - last_used <= _AGENT_POOL_IDLE_S:
+            break
+        del _agent_pool[oldest_key]
+
+    entry = _agent_pool.get(key)
+    if entry is None:
+        return None
+
+    _agent_pool[key] = (now, entry[1], entry[2])
+    _agent_pool.move_to_end(key)
+    return entry[1], entry[2]
+
+
+def _get_pooled(key: tuple, factory: Callable[[], Any]) -> tuple[Any, threading.Lock]:
+    """
+    Return a pooled instance and its in-use lock for key, creating it on a miss.
+
+    Entries idle for longer than AGENT_POOL_IDLE_S are dropped on access and
+    the least recently used entries are evicted past AGENT_POOL_MAX.
+
+    Instances are built outside the pool lock so a slow build does not block
+    other keys; a per-key build lock plus a second lookup (double-checked
+    locking) keeps concurrent misses on the same key from building twice.
+    """
+    with _agent_pool_lock:
+        entry = _pool_lookup(key)
+        if entry is not None:
+            return entry
+        build_lock = _agent_pool_build_locks.setdefault(key, threading.Lock())
+
+    with build_lock:
+        # Another invocation may have built it while we waited
+        with _agent_pool_lock:
+            entry = _pool_lookup(key)
+            if entry is not None:
+                return entry
+
+        try:
+            instance = factory()
+        except Exception:
+            with _agent_pool_lock:
+                _agent_pool_build_locks.pop(key, None)
+            raise
+
+        in_use = threading.Lock()
+        with _agent_pool_lock:
+            _agent_pool[key] = (time.monotonic(), instance, in_use)
+            _agent_pool_build_locks.pop(key, None)
+            while len(_agent_pool) > _AGENT_POOL_MAX:
+                _agent_pool.popitem(last=False)
+
+        return instance, in_use
+
+
+def _evict_pooled(key: tuple, instance: Any) -> None:
+    """Drop key from the pool if it still holds instance."""
+    with _agent_pool_lock:
+        entry = _agent_pool.get(key)
+        if entry is not None and entry[1] is instance:
+            del _agent_pool[key]
+
+
+@contextmanager
+def _checkout_pooled(
+    key: tuple,
+    factory: Callable[[], Any],
+    wait_s: float = 0,
+    persistent: bool = False,
+) -> Iterator[Any]:
+    """
+    Check out the pooled instance for key for exclusive use by one invocation.
+
+    Strands agents cannot be invoked concurrently, so if the pooled instance
+    is still busy with another invocation after wait_s, a fresh unpooled
+    instance is built for this one instead (the same fallback
+    run_proactive_workflow uses).
+
+    Args:
+        key: Pool key.
+        factory: Zero-argument callable building an instance for key.
+        wait_s: Seconds to wait for a busy pooled instance before falling back.
+        persistent: Instances for key share persisted state (a memory-backed
+                   session). A fallback turn then leaves the pooled instance's
+                   in-memory state stale, so it is evicted afterwards and the
+                   next checkout restores the session from memory.
+    """
+    instance, in_use = _get_pooled(key, factory)
+
+    acquired = in_use.acquire(timeout=wait_s) if wait_s > 0 else in_use.acquire(blocking=False)
+    if not acquired:
+        logger.info(f"Pooled {key[0]} busy - using a fresh instance")
+        try:
+            yield factory()
+        finally:
+            if persistent:
+                _evict_pooled(key, instance)
+        return
+
+    try:
+        yield instance
+    finally:
+        in_use.release()
+
+
+def get_orchestrator(
+    session_id: str, messages: list | None = None
+) -> AbstractContextManager["OrchestratorAgent"]:
+    """
+    Check out a warm OrchestratorAgent for the session, building it on first use.
+
+    Session and actor IDs are the same (see handle_chat), so the session ID
+    fully identifies the memory-backed conversation. Use as a context manager;
+    the orchestrator is held exclusively until the block exits. A turn that
+    finds it busy waits up to _SESSION_CHECKOUT_WAIT_S before running on a
+    fresh orchestrator, after which the stale pooled one is evicted.
+
+    Args:
+        session_id: Session (and actor) ID for AgentCore Memory.
+        messages: Optional messages to seed a newly built orchestrator with.
+                 Ignored when a warm orchestrator already exists for the session.
+    """
+    from src.agents import OrchestratorAgent
+
+    return _checkout_pooled(
+        _agent_pool_key("orchestrator", session_id),
+        lambda: OrchestratorAgent(
+            session_id=session_id,
+            enable_memory=True,
+            actor_id=session_id,
+            messages=messages,
+        ),
+        wait_s=_SESSION_CHECKOUT_WAIT_S,
+        persistent=True,
+    )
+
+
+def _orchestrator_from_state_blob(state_blob: str | None) -> "OrchestratorAgent":
+    """
+    Build a memory-less orchestrator seeded from a payload state blob.
+
+    Raises:
+        ValueError: If the blob is malformed.
+    """
+    from src.agents import OrchestratorAgent
+    from src.agents.base import AgentState
+    from src.memory import decode_state_blob
+
+    if not state_blob:
+        return OrchestratorAgent(enable_memory=False)
+
+    seed = decode_state_blob(state_blob)
+    try:
+        state = AgentState.from_state_dict(seed["state"]) if seed["state"] else None
+    except ValueError as e:
+        raise ValueError(f"Invalid state_blob: {e}") from e
+
+    orchestrator = OrchestratorAgent(enable_memory=False, messages=seed["messages"])
+    if state is not None:
+        orchestrator.restore_state(state)
+    return orchestrator
+
+
+def _export_payload_state(orchestrator: "OrchestratorAgent", session_id: str) -> dict:
+    """
+    Export a payload-state orchestrator for the chat response.
+
+    Returns the new state blob while it fits within the payload limit.
+    Otherwise the conversation spills over to a new memory-backed session
+    and the client continues with the returned session_id alone. A new
+    session is used because an orchestrator or memory session may already
+    exist under session_id, and seeding it would clobber that conversation.
+    """
+    from src.memory import encode_state_blob
+
+    messages = orchestrator.inner_agent.messages
+    blob = encode_state_blob(messages, orchestrator.state.to_state_dict())
+    if blob is not None:
+        return {"state_blob": blob}
+
+    spill_session_id = str(uuid.uuid4())
+    logger.info(f"Spilling session {session_id} from payload state to memory: {spill_session_id}")
+
+    # The session is new, so the orchestrator is always built with these messages
+    with get_orchestrator(spill_session_id, messages=list(messages)) as pooled:
+        pooled.restore_state(orchestrator.state)
+        # Persist now: the pooled orchestrator may be evicted before it is invoked
+        pooled.persist_session()
+    return {"session_id": spill_session_id, "state_spilled": True}
+
+
+def get_swarm() -> AbstractContextManager["AIOpsSwarm"]:
+    """Check out a warm AIOpsSwarm for exclusive use, building it on first use."""
+    from src.workflows import AIOpsSwarm
+
+    # Keyed on the resolved config of every member agent
+    key = tuple(_agent_pool_key(agent_type) for agent_type in _SWARM_AGENT_TYPES)
+    return _checkout_pooled(key, AIOpsSwarm)
+
+
 def handle_proactive(payload: dict) -> dict:
     """Handle proactive workflow mode - starts in background, returns immediately."""
 
@@ -101,10 +365,13 @@ def handle_proactive(payload: dict) -> dict:
             logger.info("=== PROACTIVE WORKFLOW STARTED ===")
             sys.stdout.flush()
 
+            from src.workflows import run_proactive_workflow
+
             result = run_proactive_workflow(destination_sink=payload.get("destination_sink", "s3"))
 
             logger.info("=== PROACTIVE WORKFLOW COMPLETED ===")
-            logger.info(f"Workflow result: {json.dumps(result, default=str)[:1000]}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Workflow result: %s", json_utils.dumps(result)[:1000])
             sys.stdout.flush()
 
         except Exception as e:
@@ -135,12 +402,18 @@ def handle_chat(payload: dict) -> dict:
     Uses the OrchestratorAgent for multi-turn conversations.
     When deployed on AgentCore with memory configured, conversation
     history is persisted via the AgentCore Memory service.
+
+    Short sessions can instead round-trip their state through the payload:
+    send "continuation": true on the first turn and echo back the returned
+    "state_blob" on later turns. Once the blob outgrows the payload limit
+    the response carries "state_spilled": true and the session continues
+    in memory under the returned (new) session_id.
     """
     message = payload.get("message", "")
     session_id = payload.get("session_id")  # Single ID for both session and actor
 
     if not message:
-        return {"success": False, "error": "Missing 'message' in payload"}
+        return dict(_ERR_MISSING_MESSAGE)
 
     # Use session_id for BOTH session_id and actor_id (Option B from docs)
     # This ensures consistent memory lookup across invocations
@@ -158,29 +431,41 @@ def handle_chat(payload: dict) -> dict:
     actor_id = session_id
     logger.info(f"Memory lookup key: session_id={session_id}, actor_id={actor_id}")
 
-    # Create orchestrator with session and memory enabled
-    # Memory persistence is handled via AgentCore Memory service when deployed
-    orchestrator = OrchestratorAgent(
-        session_id=session_id,
-        enable_memory=True,
-        actor_id=actor_id,
-    )
+    state_blob = payload.get("state_blob")
+    use_payload_state = bool(state_blob or payload.get("continuation"))
+
+    if use_payload_state:
+        # Conversation state travels in the payload; no memory round-trips
+        try:
+            checkout = nullcontext(_orchestrator_from_state_blob(state_blob))
+        except ValueError as e:
+            return {"success": False, "session_id": session_id, "error": str(e)}
+    else:
+        # Reuse (or create) the orchestrator with session and memory enabled
+        # Memory persistence is handled via AgentCore Memory service when deployed
+        checkout = get_orchestrator(session_id)
 
     # Invoke the orchestrator with the user message
     logger.info(f"Processing chat message: {message[:100]}...")
 
     try:
-        response = orchestrator.invoke(message)
+        with checkout as orchestrator:
+            response = orchestrator.invoke(message)
 
         # Extract the response text
         response_text = str(response) if response else "No response generated"
 
-        return {
+        result = {
             "success": True,
             "session_id": session_id,  # Client must send this back for memory to work
             "response": response_text,
         }
 
+        if use_payload_state:
+            result.update(_export_payload_state(orchestrator, session_id))
+
+        return result
+
     except Exception as e:
         logger.error(f"Chat invocation failed: {e}")
         return {
@@ -195,16 +480,26 @@ def handle_swarm(payload: dict) -> dict:
     task = payload.get("task", "")
 
     if not task:
-        return {"success": False, "error": "Missing 'task' in payload"}
+        return dict(_ERR_MISSING_TASK)
 
     logger.info(f"Running swarm task: {task[:100]}...")
 
-    swarm = AIOpsSwarm()
-    result = swarm.run(task)
+    with get_swarm() as swarm:
+        swarm.reset()  # agents_used must only reflect this task
+        result = swarm.run(task)
 
     return result.to_dict()
 
 
+# Mode -> handler dispatch table; every handler takes the full payload
+_MODE_HANDLERS: dict[str, Callable[[dict], dict]] = {
+    "proactive": handle_proactive,
+    "chat": handle_chat,
+    "swarm": handle_swarm,
+}
+_SUPPORTED_MODES = tuple(_MODE_HANDLERS)
+
+
 # @app.ping
 # def health() -> dict:
 #     """Health check endpoint for AgentCore (GET /ping)."""
@@ -5,6 +5,7 @@ Session management and conversation history for the AIOps Multi-Agent System.
 """
 
 from .agentcore_session_manager import (
+    LazySessionManager,
     create_agentcore_session_manager,
     is_running_in_agentcore,
 )
@@ -12,6 +13,11 @@ from .conversation_history import (
     ConversationEntry,
     ConversationHistory,
 )
+from .payload_state import (
+    STATE_PAYLOAD_LIMIT,
+    decode_state_blob,
+    encode_state_blob,
+)
 from .session_manager import (
     SessionManagerFactory,
     get_session_manager,
@@ -23,5 +29,9 @@ __all__ = [
     "ConversationHistory",
     "ConversationEntry",
     "create_agentcore_session_manager",
+    "LazySessionManager",
     "is_running_in_agentcore",
+    "encode_state_blob",
+    "decode_state_blob",
+    "STATE_PAYLOAD_LIMIT",
 ]
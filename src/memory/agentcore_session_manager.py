@@ -7,9 +7,11 @@ Strands integration.
 """
 
 import os
+import threading
 import traceback
 import uuid as uuid_mod
-from typing import Any
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
 
 # Import AgentCore Memory session manager
 from bedrock_agentcore.memory.integrations.strands.config import (
@@ -18,11 +20,16 @@ from bedrock_agentcore.memory.integrations.strands.config import (
 from bedrock_agentcore.memory.integrations.strands.session_manager import (
     AgentCoreMemorySessionManager,
 )
-from strands.session import FileSessionManager
+from strands.hooks import BeforeInvocationEvent, HookRegistry
+from strands.session import FileSessionManager, SessionManager
+from strands.types.content import Message
 
 from ..utils.config_loader import load_settings
 from ..utils.logging_config import get_logger
 
+if TYPE_CHECKING:
+    from strands import Agent
+
 logger = get_logger("memory.agentcore")
 
 
@@ -137,3 +144,95 @@ def create_agentcore_session_manager(
         session_id=session_id,
         storage_dir=storage_dir,
     )
+
+
+class LazySessionManager(SessionManager):
+    """
+    Session manager proxy that defers building the real manager.
+
+    Building a session manager creates AWS clients (or the local storage
+    directory) and reading the session costs a round trip, which is wasted
+    when the agent is never invoked. The proxy only hooks the agent's first
+    invocation; at that point it builds the real manager, registers its
+    hooks on the agent and restores the session, before the new prompt is
+    added to the conversation. Direct calls to the SessionManager interface
+    attach the real manager first if needed and then delegate to it.
+
+    Usage:
+        session_manager = LazySessionManager(
+            lambda: create_agentcore_session_manager(session_id="user-123")
+        )
+        agent = Agent(model=model, session_manager=session_manager)
+    """
+
+    def __init__(self, factory: Callable[[], SessionManager]):
+        """
+        Initialize the proxy.
+
+        Args:
+            factory: Zero-argument callable returning the real session manager.
+        """
+        self._factory = factory
+        self._manager: SessionManager | None = None
+        self._attached = False
+        self._lock = threading.RLock()
+
+    @property
+    def manager(self) -> SessionManager | None:
+        """The real session manager, or None until it is first needed."""
+        return self._manager
+
+    @property
+    def session_id(self) -> str:
+        """Session ID of the real manager, building it if needed."""
+        return self._get_manager().session_id
+
+    def register_hooks(self, registry: HookRegistry, **kwargs: Any) -> None:
+        """Register the hook that attaches the real manager on first invocation."""
+        registry.add_callback(BeforeInvocationEvent, self._attach)
+
+    def initialize(self, agent: "Agent", **kwargs: Any) -> None:
+        """
+        Attach the real manager to the agent now rather than on first invocation.
+
+        A new session persists the agent's current messages; an existing one
+        is restored into the agent.
+        """
+        self._attach_to(agent)
+
+    def append_message(self, message: Message, agent: "Agent", **kwargs: Any) -> None:
+        """Append a message to the session."""
+        self._attach_to(agent).append_message(message, agent, **kwargs)
+
+    def redact_latest_message(self, redact_message: Message, agent: "Agent", **kwargs: Any) -> None:
+        """Replace the latest message in the session with a redacted version."""
+        self._attach_to(agent).redact_latest_message(redact_message, agent, **kwargs)
+
+    def sync_agent(self, agent: "Agent", **kwargs: Any) -> None:
+        """Sync the agent's state to the session."""
+        self._attach_to(agent).sync_agent(agent, **kwargs)
+
+    def _attach(self, event: BeforeInvocationEvent) -> None:
+        """Build the real manager and restore the session into the agent."""
+        self._attach_to(event.agent)
+
+    def _get_manager(self) -> SessionManager:
+        """Return the real manager, building it on first use."""
+        if self._manager is None:
+            with self._lock:
+                if self._manager is None:
+                    self._manager = self._factory()
+        return self._manager
+
+    def _attach_to(self, agent: "Agent") -> SessionManager:
+        """Return the real manager, registering its hooks on the agent first if needed."""
+        if self._attached:
+            return self._manager
+
+        with self._lock:
+            manager = self._get_manager()
+            if not self._attached:
+                manager.register_hooks(agent.hooks)
+                manager.initialize(agent)
+                self._attached = True
+        return manager
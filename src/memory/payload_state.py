@@ -0,0 +1,82 @@
+"""
+Payload State Module
+
+Round-trips short chat sessions through the invocation payload instead of
+the session store. The conversation and orchestrator state are packed into
+a compressed "state blob" that the client sends back on its next turn.
+Sessions whose blob grows past the size limit spill over to the regular
+memory-backed session manager.
+"""
+
+import base64
+import binascii
+import gzip
+import io
+
+from ..utils import json_utils
+from ..utils.logging_config import get_logger
+
+logger = get_logger("memory.payload_state")
+
+# Largest encoded blob returned to the client before spilling to memory
+STATE_PAYLOAD_LIMIT = 200 * 1024
+
+# Largest decompressed state document accepted from a client blob; guards
+# against small gzip bombs inflating inside the process
+_STATE_DECODED_MAX = 8 * 1024 * 1024
+
+
+def encode_state_blob(messages: list, state: dict) -> str | None:
+    """
+    Encode conversation messages and agent state into a state blob.
+
+    Args:
+        messages: Strands conversation messages.
+        state: Serialized AgentState (AgentState.to_state_dict()).
+
+    Returns:
+        Base64 string of the gzip-compressed JSON document, or None if it
+        exceeds STATE_PAYLOAD_LIMIT and the session should spill to memory.
+    """
+    raw = json_utils.dumps({"messages": messages, "state": state}).encode("utf-8")
+    blob = base64.b64encode(gzip.compress(raw)).decode("ascii")
+
+    if len(blob) > STATE_PAYLOAD_LIMIT:
+        logger.info(f"State blob is {len(blob)} bytes, over the {STATE_PAYLOAD_LIMIT} byte limit")
+        return None
+
+    return blob
+
+
+def decode_state_blob(blob: str) -> dict:
+    """
+    Decode a state blob produced by encode_state_blob.
+
+    Args:
+        blob: Base64 state blob from the client.
+
+    Returns:
+        Dictionary with "messages" (list) and "state" (dict).
+
+    Raises:
+        ValueError: If the blob is malformed or too large.
+    """
+    if not isinstance(blob, str):
+        raise ValueError("Invalid state_blob: expected a string")
+    if len(blob) > STATE_PAYLOAD_LIMIT:
+        raise ValueError(f"Invalid state_blob: over the {STATE_PAYLOAD_LIMIT} byte limit")
+
+    try:
+        raw = base64.b64decode(blob, validate=True)
+        with gzip.GzipFile(fileobj=io.BytesIO(raw)) as f:
+            decoded = f.read(_STATE_DECODED_MAX + 1)
+        if len(decoded) > _STATE_DECODED_MAX:
+            raise ValueError(f"decompresses past {_STATE_DECODED_MAX} bytes")
+        data = json_utils.loads(decoded)
+    except (binascii.Error, EOFError, OSError, ValueError) as e:
+        raise ValueError(f"Invalid state_blob: {e}") from e
+
+    if not isinstance(data, dict) or not isinstance(data.get("messages"), list):
+        raise ValueError("Invalid state_blob: missing messages")
+
+    return {"messages": data["messages"], "state": data.get("state") or {}}
@@ -5,15 +5,245 @@ Tools for analyzing error patterns and suggesting code fixes.
 These tools can be used standalone or as part of the Coding Agent.
 """
 
+import functools
 import re
+import sys
 
 from strands import tool
 
+try:
+    import ahocorasick
+except ImportError:  # Optional speedup; fall back to per-pattern regexes
+    ahocorasick = None
+
 from ..utils.config_loader import load_tools_config
 from ..utils.logging_config import get_logger
 
 logger = get_logger("tools.code_analysis")
 
+# Patterns are compiled once at import and shared by every analyzer
+_SERVICE_PATTERN = re.compile(r"\[([a-z][\w-]*)\]", re.IGNORECASE)
+_TIMESTAMP_PATTERN = re.compile(r"\[(\d{4}-\d{2}-\d{2}[T\s]\d{2}:\d{2}:\d{2})")
+_STATUS_WORDS = frozenset({"error", "warn", "warning", "info", "debug", "fatal", "critical"})
+
+# (error type, keywords) - matched case-insensitively anywhere in a line
+_ERROR_KEYWORDS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("NullPointerException", ("NullPointerException",)),
+    ("OutOfMemoryError", ("OutOfMemoryError",)),
+    ("ConnectionRefused", ("ConnectionRefused", "Connection refused")),
+    ("Timeout", ("TimeoutException", "Timeout", "timed out")),
+    ("DatabaseError", ("SQLException", "database error")),
+    ("AuthenticationError", ("AuthenticationError", "Unauthorized", "401")),
+    ("PermissionError", ("PermissionDenied", "Forbidden", "403")),
+    ("FileNotFoundError", ("FileNotFound", "No such file")),
+    ("ValidationError", ("ValidationError", "Invalid")),
+    ("RateLimitError", ("RateLimitExceeded", "429", "Too Many Requests")),
+)
+
+# (compiled pattern, error type) - used when pyahocorasick is not installed
+_ERROR_PATTERNS: tuple[tuple[re.Pattern, str], ...] = tuple(
+    (re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE), error_type)
+    for error_type, keywords in _ERROR_KEYWORDS
+)
+
+
+def _build_keyword_automaton():
+    """Build an Aho-Corasick automaton over all error keywords, if available."""
+    if ahocorasick is None:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for order, (error_type, keywords) in enumerate(_ERROR_KEYWORDS):
+        for keyword in keywords:
+            automaton.add_word(keyword.lower(), (order, error_type))
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton()
+
+
+def _match_error_types(line: str) -> list[str]:
+    """Return the error types found in a line, in _ERROR_KEYWORDS order."""
+    if _KEYWORD_AUTOMATON is not None:
+        # One pass over the line matches every keyword at once
+        found = {value for _, value in _KEYWORD_AUTOMATON.iter(line.lower())}
+        return [error_type for _, error_type in sorted(found)]
+
+    return [error_type for pattern, error_type in _ERROR_PATTERNS if pattern.search(line)]
+
+
+@functools.lru_cache(maxsize=128)
+def _scan_log_context(log_context: str) -> tuple[tuple, ...]:
+    """
+    Scan log context line by line for services, timestamps and error types.
+
+    Results are memoized so a log context re-analyzed on a retry or
+    re-prompt is only scanned once. Everything returned is immutable.
+
+    Returns:
+        Tuple of (error_types, affected_services, timestamps, stack_traces,
+        recurring_issues), where recurring_issues holds (type, count) pairs.
+    """
+    error_types: list[str] = []
+    services: set[str] = set()
+    timestamps: list[str] = []
+    stack_traces: list[str] = []
+    error_counts: dict[str, int] = {}
+
+    for line in log_context.split("\n"):
+        if not line.strip():
+            continue
+
+        # Extract service name (look for [service-name] pattern, but not status words)
+        for match in _SERVICE_PATTERN.finditer(line):
+            service_name = match.group(1)
+            if service_name.lower() not in _STATUS_WORDS:
+                services.add(sys.intern(service_name))
+                break  # Take first non-status match as service
+
+        # Extract timestamp
+        ts_match = _TIMESTAMP_PATTERN.search(line)
+        if ts_match:
+            timestamps.append(ts_match.group(1))
+
+        # Identify error types
+        for error_type in _match_error_types(line):
+            if error_type not in error_types:
+                error_types.append(error_type)
+            error_counts[error_type] = error_counts.get(error_type, 0) + 1
+
+        # Check for stack traces
+        if "at " in line and "(" in line and ")" in line:
+            stack_traces.append(line.strip())
+
+    # Identify recurring issues (more than 3 occurrences)
+    recurring = tuple((error, count) for error, count in error_counts.items() if count >= 3)
+
+    return tuple(error_types), tuple(services), tuple(timestamps), tuple(stack_traces), recurring
+
+
+# Fix suggestion templates for common error types
+_FIX_TEMPLATES: dict[str, dict[str, str]] = {
+    "NullPointerException": {
+        "issue": "Null pointer reference",
+        "suggestion": "Add null checks before accessing object properties",
+        "code_snippet": """
+# Python example
+if obj is not None:
+    result = obj.property
+else:
+    result = default_value
+
+# Or use Optional with get()
+result = obj.get('property', default_value) if obj else default_value
+""",
+        "prevention": "Use Optional types and null-safe operators",
+    },
+    "ConnectionRefused": {
+        "issue": "Service connection failure",
+        "suggestion": "Implement retry logic with exponential backoff",
+        "code_snippet": """
+import time
+from functools import wraps
+
+def retry_with_backoff(max_retries=3, base_delay=1):
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            for attempt in range(max_retries):
+                try:
+                    return func(*args, **kwargs)
+                except ConnectionError:
+                    if attempt == max_retries - 1:
+                        raise
+                    delay = base_delay * (2 ** attempt)
+                    time.sleep(delay)
+        return wrapper
+    return decorator
+""",
+        "prevention": "Use connection pools and health checks",
+    },
+    "Timeout": {
+        "issue": "Request timeout",
+        "suggestion": "Increase timeout values and add async processing",
+        "code_snippet": """
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+# Increase timeout
+response = requests.get(url, timeout=30)  # Increased from default
+
+# Or use async for long operations
+async def fetch_with_timeout(url, timeout=30):
+    async with aiohttp.ClientSession() as session:
+        async with session.get(url, timeout=timeout) as response:
+            return await response.json()
+""",
+        "prevention": "Monitor response times and set appropriate timeouts",
+    },
+    "OutOfMemoryError": {
+        "issue": "Memory exhaustion",
+        "suggestion": "Profile memory usage and optimize allocations",
+        "code_snippet": """
+# Use generators for large data
+def process_large_file(filepath):
+    with open(filepath) as f:
+        for line in f:  # Process line by line
+            yield process_line(line)
+
+# Explicitly free memory
+import gc
+del large_object
+gc.collect()
+""",
+        "prevention": "Set memory limits and implement pagination for large datasets",
+    },
+    "DatabaseError": {
+        "issue": "Database operation failure",
+        "suggestion": "Check connection pool settings and query optimization",
+        "code_snippet": """
+# Use connection pooling
+from sqlalchemy import create_engine
+from sqlalchemy.pool import QueuePool
+
+engine = create_engine(
+    db_url,
+    poolclass=QueuePool,
+    pool_size=5,
+    max_overflow=10,
+    pool_timeout=30
+)
+
+# Add query timeout
+with engine.connect() as conn:
+    conn.execute(text("SET statement_timeout = '30s'"))
+""",
+        "prevention": "Monitor connection pool metrics and slow queries",
+    },
+    "RateLimitError": {
+        "issue": "API rate limit exceeded",
+        "suggestion": "Implement rate limiting and request queuing",
+        "code_snippet": """
+from ratelimit import limits, sleep_and_retry
+
+@sleep_and_retry
+@limits(calls=100, period=60)  # 100 calls per minute
+def call_api(endpoint):
+    return requests.get(endpoint)
+
+# Or use token bucket
+class TokenBucket:
+    def __init__(self, tokens, fill_rate):
+        self.capacity = tokens
+        self.tokens = tokens
+        self.fill_rate = fill_rate
+        self.last_time = time.time()
+""",
+        "prevention": "Cache responses and batch requests where possible",
+    },
+}
+
 
 class CodeAnalyzer:
     """
@@ -42,67 +272,18 @@ class CodeAnalyzer:
         Returns:
             Dictionary containing identified patterns and analysis.
         """
+        error_types, services, timestamps, stack_traces, recurring = _scan_log_context(log_context)
+
+        # Fresh containers on every call so callers can't mutate the cached scan
         patterns = {
-            "error_types": [],
-            "affected_services": set(),
-            "timestamps": [],
-            "stack_traces": [],
-            "recurring_issues": [],
+            "error_types": list(error_types),
+            "affected_services": list(services),
+            "timestamps": list(timestamps),
+            "stack_traces": list(stack_traces),
+            "recurring_issues": [{"type": error, "count": count} for error, count in recurring],
             "potential_causes": [],
         }
 
-        lines = log_context.split("\n")
-        error_counts: dict[str, int] = {}
-
-        for line in lines:
-            if not line.strip():
-                continue
-
-            # Extract service name (look for [service-name] pattern, but not status words)
-            status_words = {"error", "warn", "warning", "info", "debug", "fatal", "critical"}
-            for match in re.finditer(r"\[([a-z][\w-]*)\]", line, re.IGNORECASE):
-                service_name = match.group(1)
-                if service_name.lower() not in status_words:
-                    patterns["affected_services"].add(service_name)
-                    break  # Take first non-status match as service
-
-            # Extract timestamp
-            ts_match = re.search(r"\[(\d{4}-\d{2}-\d{2}[T\s]\d{2}:\d{2}:\d{2})", line)
-            if ts_match:
-                patterns["timestamps"].append(ts_match.group(1))
-
-            # Identify error types
-            error_patterns = [
-                (r"(NullPointerException)", "NullPointerException"),
-                (r"(OutOfMemoryError)", "OutOfMemoryError"),
-                (r"(ConnectionRefused|Connection refused)", "ConnectionRefused"),
-                (r"(TimeoutException|Timeout|timed out)", "Timeout"),
-                (r"(SQLException|database error)", "DatabaseError"),
-                (r"(AuthenticationError|Unauthorized|401)", "AuthenticationError"),
-                (r"(PermissionDenied|Forbidden|403)", "PermissionError"),
-                (r"(FileNotFound|No such file)", "FileNotFoundError"),
-                (r"(ValidationError|Invalid)", "ValidationError"),
-                (r"(RateLimitExceeded|429|Too Many Requests)", "RateLimitError"),
-            ]
-
-            for pattern, error_type in error_patterns:
-                if re.search(pattern, line, re.IGNORECASE):
-                    if error_type not in patterns["error_types"]:
-                        patterns["error_types"].append(error_type)
-                    error_counts[error_type] = error_counts.get(error_type, 0) + 1
-
-            # Check for stack traces
-            if "at " in line and "(" in line and ")" in line:
-                patterns["stack_traces"].append(line.strip())
-
-        # Identify recurring issues (more than 3 occurrences)
-        patterns["recurring_issues"] = [
-            {"type": error, "count": count} for error, count in error_counts.items() if count >= 3
-        ]
-
-        # Convert set to list for JSON serialization
-        patterns["affected_services"] = list(patterns["affected_services"])
-
         # Analyze potential causes
         patterns["potential_causes"] = self._identify_causes(patterns)
 
@@ -194,130 +375,9 @@ class CodeAnalyzer:
         suggestions = []
         error_types = patterns.get("error_types", [])
 
-        # Fix suggestions for common error types
-        fix_templates = {
-            "NullPointerException": {
-                "issue": "Null pointer reference",
-                "suggestion": "Add null checks before accessing object properties",
-                "code_snippet": """
-# Python example
-if obj is not None:
-    result = obj.property
-else:
-    result = default_value
-
-# Or use Optional with get()
-result = obj.get('property', default_value) if obj else default_value
-""",
-                "prevention": "Use Optional types and null-safe operators",
-            },
-            "ConnectionRefused": {
-                "issue": "Service connection failure",
-                "suggestion": "Implement retry logic with exponential backoff",
-                "code_snippet": """
-import time
-from functools import wraps
-
-def retry_with_backoff(max_retries=3, base_delay=1):
-    def decorator(func):
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            for attempt in range(max_retries):
-                try:
-                    return func(*args, **kwargs)
-                except ConnectionError:
-                    if attempt == max_retries - 1:
-                        raise
-                    delay = base_delay * (2 ** attempt)
-                    time.sleep(delay)
-        return wrapper
-    return decorator
-""",
-                "prevention": "Use connection pools and health checks",
-            },
-            "Timeout": {
-                "issue": "Request timeout",
-                "suggestion": "Increase timeout values and add async processing",
-                "code_snippet": """
-import asyncio
-from concurrent.futures import ThreadPoolExecutor
-
-# Increase timeout
-response = requests.get(url, timeout=30)  # Increased from default
-
-# Or use async for long operations
-async def fetch_with_timeout(url, timeout=30):
-    async with aiohttp.ClientSession() as session:
-        async with session.get(url, timeout=timeout) as response:
-            return await response.json()
-""",
-                "prevention": "Monitor response times and set appropriate timeouts",
-            },
-            "OutOfMemoryError": {
-                "issue": "Memory exhaustion",
-                "suggestion": "Profile memory usage and optimize allocations",
-                "code_snippet": """
-# Use generators for large data
-def process_large_file(filepath):
-    with open(filepath) as f:
-        for line in f:  # Process line by line
-            yield process_line(line)
-
-# Explicitly free memory
-import gc
-del large_object
-gc.collect()
-""",
-                "prevention": "Set memory limits and implement pagination for large datasets",
-            },
-            "DatabaseError": {
-                "issue": "Database operation failure",
-                "suggestion": "Check connection pool settings and query optimization",
-                "code_snippet": """
-# Use connection pooling
-from sqlalchemy import create_engine
-from sqlalchemy.pool import QueuePool
-
-engine = create_engine(
-    db_url,
-    poolclass=QueuePool,
-    pool_size=5,
-    max_overflow=10,
-    pool_timeout=30
-)
-
-# Add query timeout
-with engine.connect() as conn:
-    conn.execute(text("SET statement_timeout = '30s'"))
-""",
-                "prevention": "Monitor connection pool metrics and slow queries",
-            },
-            "RateLimitError": {
-                "issue": "API rate limit exceeded",
-                "suggestion": "Implement rate limiting and request queuing",
-                "code_snippet": """
-from ratelimit import limits, sleep_and_retry
-
-@sleep_and_retry
-@limits(calls=100, period=60)  # 100 calls per minute
-def call_api(endpoint):
-    return requests.get(endpoint)
-
-# Or use token bucket
-class TokenBucket:
-    def __init__(self, tokens, fill_rate):
-        self.capacity = tokens
-        self.tokens = tokens
-        self.fill_rate = fill_rate
-        self.last_time = time.time()
-""",
-                "prevention": "Cache responses and batch requests where possible",
-            },
-        }
-
         for error_type in error_types:
-            if error_type in fix_templates:
-                template = fix_templates[error_type]
+            template = _FIX_TEMPLATES.get(error_type)
+            if template is not None:
                 suggestions.append(
                     {
                         "error_type": error_type,
@@ -343,6 +403,26 @@ class TokenBucket:
 
         return suggestions
 
+    def full_pass(
+        self,
+        log_context: str,
+        service_name: str = "",
+    ) -> tuple[dict, str, list[dict]]:
+        """
+        Analyze patterns, assess severity and suggest fixes in one call.
+
+        Args:
+            log_context: Formatted log entries as a string.
+            service_name: Name of the affected service.
+
+        Returns:
+            Tuple of (patterns, severity, suggestions) as returned by
+            analyze_patterns, assess_severity and suggest_fixes.
+        """
+        patterns = self.analyze_patterns(log_context)
+        severity = self.assess_severity(patterns)
+        return patterns, severity, self.suggest_fixes(patterns, service_name)
+
 
 # Create a default analyzer instance
 _default_analyzer: CodeAnalyzer | None = None
@@ -6,6 +6,10 @@ These tools can be used standalone or as part of the DataDog Agent.
 """
 
 import os
+import sys
+import threading
+import time
+from types import MappingProxyType
 
 import requests
 from strands import tool
@@ -15,6 +19,59 @@ from ..utils.logging_config import get_logger
 
 logger = get_logger("tools.datadog")
 
+# Shared read-only stand-in for logs without attributes, so lookups like
+# (log.get("attributes") or NO_ATTRIBUTES).get(...) never allocate a dict
+NO_ATTRIBUTES = MappingProxyType({})
+
+# Short-lived cache of successful log queries, shared by all clients.
+# key -> (monotonic expiry, logs); insertion order doubles as age order.
+_QUERY_CACHE_MAX = 64
+_query_cache: dict[tuple, tuple[float, list[dict]]] = {}
+_query_cache_lock = threading.Lock()
+
+# Attribute fields repeated across many logs; interned so grouping and
+# comparisons hash and compare the same string objects
+_INTERNED_FIELDS = ("service", "status")
+
+
+def _get_cached_query(key: tuple) -> list[dict] | None:
+    """Return cached logs for a query key, or None if missing or expired."""
+    with _query_cache_lock:
+        entry = _query_cache.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del _query_cache[key]
+            return None
+        return list(entry[1])
+
+
+def _cache_query(key: tuple, logs: list[dict], ttl: float) -> None:
+    """Cache logs for a query key for ttl seconds."""
+    with _query_cache_lock:
+        _query_cache.pop(key, None)
+        _query_cache[key] = (time.monotonic() + ttl, list(logs))
+        while len(_query_cache) > _QUERY_CACHE_MAX:
+            del _query_cache[next(iter(_query_cache))]
+
+
+def _intern_log_fields(logs: list[dict]) -> None:
+    """Intern the low-cardinality service and status fields of each log in place."""
+    for log in logs:
+        attrs = log.get("attributes") if isinstance(log, dict) else None
+        if not isinstance(attrs, dict):
+            continue
+        for key in _INTERNED_FIELDS:
+            value = attrs.get(key)
+            if isinstance(value, str):
+                attrs[key] = sys.intern(value)
+
+
+def clear_query_cache() -> None:
+    """Drop all cached DataDog query results."""
+    with _query_cache_lock:
+        _query_cache.clear()
+
 
 class DataDogClient:
     """
@@ -95,6 +152,23 @@ class DataDogClient:
         effective_query = query or query_config.get("default_query", "status:(error OR warn)")
         effective_limit = limit or query_config.get("limit", 50)
 
+        # Relative times like "now-1d" are part of the key as-is; the short
+        # TTL bounds how far a cached window can drift from the live one
+        cache_ttl = query_config.get("cache_ttl_seconds", 60)
+        cache_key = (
+            self._base_url,
+            self._api_key,
+            effective_query,
+            time_from,
+            time_to,
+            effective_limit,
+        )
+        if cache_ttl > 0:
+            cached = _get_cached_query(cache_key)
+            if cached is not None:
+                logger.info(f"Serving cached DataDog logs: query='{effective_query}'")
+                return cached
+
         endpoint = self._config.get("endpoints", {}).get("logs_search", "/api/v2/logs/events/search")
         url = f"{self._base_url}{endpoint}"
 
@@ -120,8 +194,12 @@ class DataDogClient:
 
             data = response.json()
             logs = data.get("data", [])
+            _intern_log_fields(logs)
 
             logger.info(f"Retrieved {len(logs)} log entries from DataDog")
+
+            if cache_ttl > 0:
+                _cache_query(cache_key, logs, cache_ttl)
             return logs
 
         except requests.exceptions.Timeout:
@@ -141,19 +219,39 @@ class DataDogClient:
         Returns:
             Set of unique service names.
         """
-        services = set()
-
-        for log in logs:
-            try:
-                service = log.get("attributes", {}).get("service")
-                if service:
-                    services.add(service)
-            except (AttributeError, TypeError):
-                continue
+        # One comprehension; malformed entries are skipped by the type checks
+        services = {
+            service
+            for log in logs
+            if isinstance(log, dict)
+            and isinstance(attrs := log.get("attributes"), dict)
+            and isinstance(service := attrs.get("service"), str)
+            and service
+        }
 
         logger.info(f"Extracted {len(services)} unique services: {services}")
         return services
 
+    def group_by_service(self, logs: list[dict]) -> dict[str, list[dict]]:
+        """
+        Bucket log entries by service name in a single pass.
+
+        Args:
+            logs: List of log entries from query_logs.
+
+        Returns:
+            Dictionary mapping service name to its log entries, in log order.
+            Entries without a service are skipped.
+        """
+        by_service: dict[str, list[dict]] = {}
+
+        for log in logs:
+            service = (log.get("attributes") or NO_ATTRIBUTES).get("service")
+            if service:
+                by_service.setdefault(service, []).append(log)
+
+        return by_service
+
     def format_logs(
         self,
         logs: list[dict],
@@ -178,7 +276,11 @@ class DataDogClient:
 
         # Filter by service if specified
         if service:
-            logs = [log for log in logs if log.get("attributes", {}).get("service") == service]
+            logs = [
+                log
+                for log in logs
+                if (log.get("attributes") or NO_ATTRIBUTES).get("service") == service
+            ]
 
         # Limit number of logs
         logs = logs[:max_logs]
@@ -186,7 +288,7 @@ class DataDogClient:
         formatted_entries = []
 
         for log in logs:
-            attrs = log.get("attributes", {})
+            attrs = log.get("attributes") or NO_ATTRIBUTES
 
             timestamp = attrs.get("timestamp", "N/A")
             status = attrs.get("status", "N/A")
@@ -6,9 +6,11 @@ These tools can be used standalone or as part of the S3 Agent.
 """
 
 import os
+import threading
 from datetime import UTC, datetime
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from strands import tool
 
@@ -17,6 +19,33 @@ from ..utils.logging_config import get_logger
 
 logger = get_logger("tools.s3")
 
+# boto3 clients are thread-safe, so every S3Client in a region shares one
+# client (and its credential resolution and connection pool)
+_S3_CLIENT_CONFIG = Config(max_pool_connections=50, retries={"mode": "adaptive"})
+_boto3_clients: dict[str, object] = {}
+_boto3_clients_lock = threading.Lock()
+
+
+def _get_boto3_client(region: str):
+    """Get or create the shared boto3 S3 client for a region."""
+    with _boto3_clients_lock:
+        client = _boto3_clients.get(region)
+        if client is None:
+            client = boto3.client("s3", region_name=region, config=_S3_CLIENT_CONFIG)
+            _boto3_clients[region] = client
+    return client
+
+
+def clear_s3_client_cache() -> None:
+    """Drop the shared boto3 S3 clients (e.g. after credentials change)."""
+    with _boto3_clients_lock:
+        _boto3_clients.clear()
+
+
+def _encode_body(content: str | bytes) -> bytes:
+    """Encode report content for put_object; bytes pass through without a copy."""
+    return content if isinstance(content, bytes) else content.encode("utf-8")
+
 
 class S3Client:
     """
@@ -45,12 +74,8 @@ class S3Client:
             bucket: S3 bucket name. Defaults to S3_REPORTS_BUCKET env var.
             region: AWS region. Defaults to config.
         """
-        # Ensure environment variables are loaded from .env file (for local development)
-        # In deployed environments, this is a no-op and boto3 uses IAM role credentials
-        from dotenv import load_dotenv
-
-        load_dotenv()
-
+        # .env (for local development) is loaded once when config_loader is imported;
+        # in deployed environments boto3 uses IAM role credentials
         settings = load_settings()
 
         self._bucket = bucket or os.environ.get("S3_REPORTS_BUCKET")
@@ -62,12 +87,12 @@ class S3Client:
         # Use boto3 default credential chain:
         # - Local: picks up AWS_ACCESS_KEY_ID/AWS_SECRET_ACCESS_KEY from environment
         # - Deployed: automatically uses IAM role credentials
-        self._client = boto3.client("s3", region_name=self._region)
+        self._client = _get_boto3_client(self._region)
 
     def upload_report(
         self,
         service_name: str,
-        content: str,
+        content: str | bytes,
         timestamp: str | None = None,
     ) -> dict:
         """
@@ -75,7 +100,7 @@ class S3Client:
 
         Args:
             service_name: Name of the service.
-            content: Markdown content of the report.
+            content: Markdown content of the report (str, or already UTF-8 encoded bytes).
             timestamp: Optional timestamp. Defaults to current time.
 
         Returns:
@@ -94,12 +119,12 @@ class S3Client:
             self._client.put_object(
                 Bucket=self._bucket,
                 Key=key,
-                Body=content.encode("utf-8"),
+                Body=_encode_body(content),
                 ContentType="text/markdown",
             )
 
             s3_uri = f"s3://{self._bucket}/{key}"
-            logger.info(f"Uploaded report: {s3_uri}")
+            logger.info("Uploaded report: %s", s3_uri)
 
             return {
                 "success": True,
@@ -114,14 +139,14 @@ class S3Client:
 
     def upload_summary(
         self,
-        content: str,
+        content: str | bytes,
         timestamp: str | None = None,
     ) -> dict:
         """
         Upload a summary report to the summaries folder.
 
         Args:
-            content: Markdown content of the summary.
+            content: Markdown content of the summary (str, or already UTF-8 encoded bytes).
             timestamp: Optional timestamp. Defaults to current time.
 
         Returns:
@@ -142,12 +167,12 @@ class S3Client:
             self._client.put_object(
                 Bucket=self._bucket,
                 Key=key,
-                Body=content.encode("utf-8"),
+                Body=_encode_body(content),
                 ContentType="text/markdown",
             )
 
             s3_uri = f"s3://{self._bucket}/{key}"
-            logger.info(f"Uploaded summary: {s3_uri}")
+            logger.info("Uploaded summary: %s", s3_uri)
 
             return {
                 "success": True,
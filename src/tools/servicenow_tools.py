@@ -5,16 +5,74 @@ Tools for interacting with the ServiceNow API to manage incidents.
 These tools can be used standalone or as part of the ServiceNow Agent.
 """
 
+import base64
+import json
 import os
+import threading
+from http.cookiejar import DefaultCookiePolicy
+from urllib.parse import urlencode
 
 import requests
+from requests.adapters import HTTPAdapter
 from strands import tool
+from urllib3.util.retry import Retry
 
 from ..utils.config_loader import load_tools_config
 from ..utils.logging_config import get_logger
 
 logger = get_logger("tools.servicenow")
 
+# Every ServiceNowClient shares one pooled HTTP session, so repeated calls
+# reuse open TLS connections instead of handshaking per request. Credentials
+# are passed per request and cookies are never stored, so clients with
+# different users can share it.
+_HTTP_POOL_MAXSIZE = 50
+_http_session: requests.Session | None = None
+_http_session_lock = threading.Lock()
+
+
+def _get_http_session(retry_attempts: int = 3) -> requests.Session:
+    """Get or create the shared ServiceNow HTTP session."""
+    global _http_session
+    with _http_session_lock:
+        if _http_session is None:
+            # Retry connection failures and gateway errors on idempotent methods;
+            # urllib3 does not re-send POST/PATCH after a response, so tickets
+            # are never created twice
+            retry = Retry(
+                total=retry_attempts,
+                backoff_factor=0.2,
+                status_forcelist=(429, 502, 503, 504),
+            )
+            adapter = HTTPAdapter(
+                pool_connections=10,
+                pool_maxsize=_HTTP_POOL_MAXSIZE,
+                max_retries=retry,
+            )
+            session = requests.Session()
+            # No allowed domains: ServiceNow session cookies are never kept
+            session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _http_session = session
+    return _http_session
+
+
+def clear_http_session() -> None:
+    """Close and drop the shared ServiceNow HTTP session."""
+    global _http_session
+    with _http_session_lock:
+        if _http_session is not None:
+            _http_session.close()
+            _http_session = None
+
+
+# Headers sent with every Batch API sub-request (name/value pairs)
+_BATCH_SUB_HEADERS = [
+    {"name": "Content-Type", "value": "application/json"},
+    {"name": "Accept", "value": "application/json"},
+]
+
 
 class ServiceNowClient:
     """
@@ -62,7 +120,9 @@ class ServiceNowClient:
         if not self._instance:
             logger.warning("ServiceNow instance not configured")
 
-        self._timeout = self._config.get("request", {}).get("timeout_seconds", 30)
+        request_config = self._config.get("request", {})
+        self._timeout = request_config.get("timeout_seconds", 30)
+        self._session = _get_http_session(request_config.get("retry_attempts", 3))
 
     @property
     def base_url(self) -> str:
@@ -162,7 +222,7 @@ class ServiceNowClient:
         logger.info(f"Creating ServiceNow incident: {short_description[:50]}...")
 
         try:
-            response = requests.post(
+            response = self._session.post(
                 url,
                 auth=self.auth,
                 headers=self.headers,
@@ -212,7 +272,7 @@ class ServiceNowClient:
         logger.info(f"Updating incident: {sys_id}")
 
         try:
-            response = requests.patch(
+            response = self._session.patch(
                 url,
                 auth=self.auth,
                 headers=self.headers,
@@ -248,7 +308,7 @@ class ServiceNowClient:
         url = f"{self.base_url}{endpoint}/{sys_id}"
 
         try:
-            response = requests.get(
+            response = self._session.get(
                 url,
                 auth=self.auth,
                 headers=self.headers,
@@ -262,19 +322,16 @@ class ServiceNowClient:
             logger.error(f"ServiceNow get failed: {e}")
             return {"error": str(e)}
 
-    def search_incidents(
+    def search_params(
         self,
         text: str | None = None,
         states: list[str] | None = None,
         limit: int | None = None,
         mode: str = "decision",
         raw_query: str | None = None,
-    ) -> list[dict]:
+    ) -> dict:
         """
-        Search incidents in ServiceNow.
-
-        Supports structured search with optional OR-based text matching,
-        state filtering, ordering by most recent update, and result limiting.
+        Build the query string parameters for an incident search.
 
         Args:
             text: Free-text to search across configured fields.
@@ -284,16 +341,9 @@ class ServiceNowClient:
             raw_query: Optional raw sysparm_query string (takes precedence).
 
         Returns:
-            List of incident records (shape depends on mode).
+            Dict with the sysparm_query and sysparm_limit parameters.
         """
-        if not self.base_url:
-            logger.error("ServiceNow instance not configured")
-            return [{"error": "ServiceNow instance not configured"}]
-
         search_cfg = self._config.get("search", {})
-        endpoint = self._config.get("endpoints", {}).get("incidents", "/api/now/table/incident")
-
-        url = f"{self.base_url}{endpoint}"
 
         limit = limit or search_cfg.get("default_limit", 5)
         order = search_cfg.get("default_order", "ORDERBYDESCsys_updated_on")
@@ -330,42 +380,24 @@ class ServiceNowClient:
         else:
             query = order
 
-        params = {
+        return {
             "sysparm_query": query,
             "sysparm_limit": limit,
         }
 
-        logger.info(f"Searching ServiceNow incidents (mode={mode}, limit={limit})")
+    @staticmethod
+    def shape_search_results(results: list[dict], mode: str = "decision") -> list[dict]:
+        """
+        Shape raw incident search results by mode.
 
-        try:
-            response = requests.get(
-                url,
-                auth=self.auth,
-                headers=self.headers,
-                params=params,
-                timeout=self._timeout,
-            )
-            response.raise_for_status()
+        Args:
+            results: Raw incident records from the table API.
+            mode: "decision" (deduplication) or "knowledge" (resolution lookup).
 
-            results = response.json().get("result", [])
-
-            # Shape results by mode
-            if mode == "knowledge":
-                return [
-                    {
-                        "sys_id": r.get("sys_id"),
-                        "number": r.get("number"),
-                        "state": r.get("state"),
-                        "priority": r.get("priority"),
-                        "short_description": r.get("short_description"),
-                        "description": r.get("description"),
-                        "close_notes": r.get("close_notes"),
-                        "updated_on": r.get("sys_updated_on"),
-                    }
-                    for r in results
-                ]
-
-            # decision mode (default)
+        Returns:
+            List of incident records (shape depends on mode).
+        """
+        if mode == "knowledge":
             return [
                 {
                     "sys_id": r.get("sys_id"),
@@ -373,15 +405,173 @@ class ServiceNowClient:
                     "state": r.get("state"),
                     "priority": r.get("priority"),
                     "short_description": r.get("short_description"),
+                    "category": r.get("category"),
+                    "description": r.get("description"),
+                    "close_notes": r.get("close_notes"),
                     "updated_on": r.get("sys_updated_on"),
                 }
                 for r in results
             ]
 
+        # decision mode (default)
+        return [
+            {
+                "sys_id": r.get("sys_id"),
+                "number": r.get("number"),
+                "state": r.get("state"),
+                "priority": r.get("priority"),
+                "short_description": r.get("short_description"),
+                "category": r.get("category"),
+                "updated_on": r.get("sys_updated_on"),
+            }
+            for r in results
+        ]
+
+    def search_incidents(
+        self,
+        text: str | None = None,
+        states: list[str] | None = None,
+        limit: int | None = None,
+        mode: str = "decision",
+        raw_query: str | None = None,
+    ) -> list[dict]:
+        """
+        Search incidents in ServiceNow.
+
+        Supports structured search with optional OR-based text matching,
+        state filtering, ordering by most recent update, and result limiting.
+
+        Args:
+            text: Free-text to search across configured fields.
+            states: List of incident states to filter on (display values).
+            limit: Max number of results to return.
+            mode: "decision" (deduplication) or "knowledge" (resolution lookup).
+            raw_query: Optional raw sysparm_query string (takes precedence).
+
+        Returns:
+            List of incident records (shape depends on mode).
+        """
+        if not self.base_url:
+            logger.error("ServiceNow instance not configured")
+            return [{"error": "ServiceNow instance not configured"}]
+
+        endpoint = self._config.get("endpoints", {}).get("incidents", "/api/now/table/incident")
+        url = f"{self.base_url}{endpoint}"
+
+        params = self.search_params(text, states, limit, mode, raw_query)
+
+        logger.info(
+            f"Searching ServiceNow incidents (mode={mode}, limit={params['sysparm_limit']})"
+        )
+
+        try:
+            response = self._session.get(
+                url,
+                auth=self.auth,
+                headers=self.headers,
+                params=params,
+                timeout=self._timeout,
+            )
+            response.raise_for_status()
+
+            return self.shape_search_results(response.json().get("result", []), mode)
+
         except requests.exceptions.RequestException as e:
             logger.error(f"ServiceNow search failed: {e}")
             return [{"error": str(e)}]
 
+    def incident_path(self, sys_id: str | None = None, params: dict | None = None) -> str:
+        """
+        Build the instance-relative path of the incident table API.
+
+        Args:
+            sys_id: Optional sys_id of a single incident.
+            params: Optional query string parameters.
+
+        Returns:
+            Path such as "/api/now/table/incident/<sys_id>?sysparm_limit=5".
+        """
+        path = self._config.get("endpoints", {}).get("incidents", "/api/now/table/incident")
+        if sys_id:
+            path = f"{path}/{sys_id}"
+        if params:
+            path = f"{path}?{urlencode(params)}"
+        return path
+
+    def batch(self, rest_requests: list[dict]) -> list[dict]:
+        """
+        Send several REST requests in one ServiceNow Batch API call.
+
+        Args:
+            rest_requests: Sub-requests, each with "method", "url" (a path
+                          relative to the instance, see incident_path) and an
+                          optional JSON-serializable "body".
+
+        Returns:
+            One dict per sub-request, in order: the parsed JSON response body,
+            or {"error": ...} if the batch or that sub-request failed.
+        """
+        if not rest_requests:
+            return []
+
+        if not self.base_url:
+            logger.error("ServiceNow instance not configured")
+            return [{"error": "ServiceNow instance not configured"} for _ in rest_requests]
+
+        endpoint = self._config.get("endpoints", {}).get("batch", "/api/now/v1/batch")
+        url = f"{self.base_url}{endpoint}"
+
+        sub_requests = []
+        for i, request in enumerate(rest_requests):
+            sub_request = {
+                "id": str(i),
+                "method": request["method"],
+                "url": request["url"],
+                "headers": _BATCH_SUB_HEADERS,
+            }
+            if request.get("body") is not None:
+                sub_request["body"] = base64.b64encode(
+                    json.dumps(request["body"]).encode("utf-8")
+                ).decode("ascii")
+            sub_requests.append(sub_request)
+
+        payload = {"batch_request_id": os.urandom(8).hex(), "rest_requests": sub_requests}
+
+        logger.info(f"Sending ServiceNow batch of {len(sub_requests)} requests")
+
+        try:
+            response = self._session.post(
+                url,
+                auth=self.auth,
+                headers=self.headers,
+                json=payload,
+                timeout=self._timeout,
+            )
+            response.raise_for_status()
+            serviced = response.json().get("serviced_requests", [])
+
+        except requests.exceptions.RequestException as e:
+            logger.error(f"ServiceNow batch request failed: {e}")
+            return [{"error": str(e)} for _ in rest_requests]
+
+        results: list[dict] = [{"error": "Request not serviced"} for _ in rest_requests]
+        for served in serviced:
+            index = int(served["id"])
+            status_code = served.get("status_code", 0)
+            encoded_body = served.get("body")
+            try:
+                body = json.loads(base64.b64decode(encoded_body)) if encoded_body else {}
+            except ValueError as e:
+                results[index] = {"error": f"Invalid batch response body: {e}"}
+                continue
+            if status_code >= 400:
+                message = body.get("error", {}).get("message", served.get("status_text", ""))
+                results[index] = {"error": f"HTTP {status_code}: {message}"}
+            else:
+                results[index] = body
+
+        return results
+
 
 # Create a default client instance for tool functions
 _default_client: ServiceNowClient | None = None
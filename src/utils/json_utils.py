@@ -0,0 +1,51 @@
+"""
+JSON Utilities Module
+
+Fast JSON (de)serialization for invocation payloads and results.
+Uses orjson when it is installed and falls back to the standard library.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+
+
+def dumps(obj: Any) -> str:
+    """
+    Serialize an object to a JSON string.
+
+    Values that are not natively serializable (e.g. datetimes from the
+    stdlib fallback, exceptions) are converted with str(). Dataclasses
+    are serialized as objects when orjson is available.
+
+    Args:
+        obj: Object to serialize.
+
+    Returns:
+        JSON string.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=_ORJSON_OPTIONS).decode("utf-8")
+    return json.dumps(obj, default=str, separators=(",", ":"))
+
+
+def loads(data: str | bytes) -> Any:
+    """
+    Parse a JSON document.
+
+    Args:
+        data: JSON string or UTF-8 encoded bytes.
+
+    Returns:
+        Parsed Python object.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
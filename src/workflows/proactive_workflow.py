@@ -7,6 +7,8 @@ Uses ThreadPoolExecutor for parallel processing and Swarm for agent coordination
 
 import re
 import sys
+import threading
+import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import UTC, datetime
@@ -19,6 +21,12 @@ from .swarm_coordinator import AIOpsSwarm
 
 logger = get_logger("workflows.proactive")
 
+# Warm workflows are reused across invocations in the same container so that
+# scheduled runs with unchanged settings skip rebuilding their agents.
+_WORKFLOW_CACHE_TTL_S = 600
+_workflow_cache: dict[tuple, tuple[float, "ProactiveWorkflow", threading.Lock]] = {}
+_workflow_cache_lock = threading.Lock()
+
 
 @dataclass
 class ServiceResult:
@@ -91,26 +99,14 @@ class ProactiveWorkflow:
         if not service_result.success:
             return  # Skip failed services
 
-        # Generate content for the individual service report
-        content = (
-            f"# Service Report: {service_result.service_name}\n\n"
-            f"- Severity: {service_result.severity}\n"
-            f"- Ticket Number: {service_result.ticket_number or 'N/A'}\n"
-            f"- Duration: {service_result.duration_seconds:.2f} sec\n"
-            f"- Agents Used: {', '.join(service_result.agents_used) if service_result.agents_used else 'None'}\n"
-        )
+        content = self._service_report_content(service_result)
 
         if destination_sink == "s3":
             result = self._s3_agent.upload_report(
                 service_name=service_result.service_name,
                 content=content,
             )
-            if result.get("success"):
-                logger.info(f"Individual report uploaded to S3: {result.get('s3_uri')}")
-            else:
-                logger.error(
-                    f"Failed to upload individual report for {service_result.service_name}: {result.get('error')}"
-                )
+            self._log_report_upload(service_result.service_name, result)
 
         elif destination_sink == "msteams":
             result = self._msteams_client.send_notification(
@@ -124,6 +120,37 @@ class ProactiveWorkflow:
                     f"Failed to send individual report to MS Teams for {service_result.service_name}: {result.get('error')}"
                 )
 
+    @staticmethod
+    def _service_report_content(service_result: ServiceResult) -> str:
+        """Generate the content of an individual service report."""
+        return (
+            f"# Service Report: {service_result.service_name}\n\n"
+            f"- Severity: {service_result.severity}\n"
+            f"- Ticket Number: {service_result.ticket_number or 'N/A'}\n"
+            f"- Duration: {service_result.duration_seconds:.2f} sec\n"
+            f"- Agents Used: {', '.join(service_result.agents_used) if service_result.agents_used else 'None'}\n"
+        )
+
+    @staticmethod
+    def _log_report_upload(service_name: str, result: dict) -> None:
+        """Log the outcome of an individual report upload to S3."""
+        if result.get("success"):
+            logger.info(f"Individual report uploaded to S3: {result.get('s3_uri')}")
+        else:
+            logger.error(
+                f"Failed to upload individual report for {service_name}: {result.get('error')}"
+            )
+
+    def _upload_service_reports_s3(self, results: list[ServiceResult]) -> None:
+        """Upload the successful services' individual reports to S3 concurrently."""
+        successful = [r for r in results if r.success]
+        items = [(r.service_name, self._service_report_content(r), None) for r in successful]
+
+        for service_result, result in zip(
+            successful, self._s3_agent.upload_reports_bulk(items), strict=True
+        ):
+            self._log_report_upload(service_result.service_name, result)
+
     def run(self, destination_sink: str) -> dict:
         """
         Execute the proactive workflow.
@@ -132,7 +159,9 @@ class ProactiveWorkflow:
             Dictionary containing the complete workflow report.
         """
 
+        # A warm workflow must not carry the previous run's end time over
         self._start_time = datetime.now(UTC)
+        self._end_time = None
         logger.info("=" * 50)
         logger.info("PROACTIVE WORKFLOW RUN STARTING")
         logger.info(f"Time range: {self._time_from} to {self._time_to}")
@@ -195,8 +224,11 @@ class ProactiveWorkflow:
         """Prepare log data for each service."""
         service_data = []
 
+        # Bucket once instead of filtering the full log list per service
+        logs_by_service = self._datadog_agent.group_logs_by_service(logs)
+
         for service in services:
-            formatted = self._datadog_agent.format_logs(logs, service=service)
+            formatted = self._datadog_agent.format_logs(logs_by_service.get(service, []))
 
             service_data.append(
                 {
@@ -376,8 +408,12 @@ Service name: {service_name}
 
         # --- Optionally upload/send individual service reports ---
         if upload_individual_reports:
-            for service_result in results:
-                self._upload_service_report(service_result, destination_sink=destination_sink)
+            if destination_sink == "s3":
+                # Independent PUTs, so they are sent concurrently
+                self._upload_service_reports_s3(results)
+            else:
+                for service_result in results:
+                    self._upload_service_report(service_result, destination_sink=destination_sink)
 
     def _generate_summary(self, results: list[ServiceResult]) -> str:
         """Generate a clean summary report."""
@@ -482,12 +518,53 @@ Service name: {service_name}
         return (end - self._start_time).total_seconds()
 
 
+def _get_cached_workflow() -> tuple["ProactiveWorkflow", threading.Lock]:
+    """
+    Get the warm workflow for the current workflow settings.
+
+    Entries older than _WORKFLOW_CACHE_TTL_S are rebuilt.
+
+    Returns:
+        Tuple of (workflow, run lock guarding that workflow's run state).
+    """
+    workflow_config = load_settings().get("workflow", {})
+    key = (
+        workflow_config.get("default_time_from", "now-1d"),
+        workflow_config.get("default_time_to", "now"),
+        workflow_config.get("max_workers", 50),
+    )
+    now = time.monotonic()
+
+    with _workflow_cache_lock:
+        for cached_key, (created, _, _) in list(_workflow_cache.items()):
+            if now - created > _WORKFLOW_CACHE_TTL_S:
+                del _workflow_cache[cached_key]
+
+        entry = _workflow_cache.get(key)
+        if entry is None:
+            entry = (now, ProactiveWorkflow(), threading.Lock())
+            _workflow_cache[key] = entry
+
+    return entry[1], entry[2]
+
+
 def run_proactive_workflow(destination_sink: str) -> dict:
     """
     Convenience function to run the proactive workflow.
 
+    Reuses a warm workflow when possible. If the cached workflow is still
+    busy with an overlapping run, a fresh one is built for this run.
+
     Returns:
         Workflow report dictionary.
     """
-    workflow = ProactiveWorkflow()
-    return workflow.run(destination_sink=destination_sink)
+    workflow, run_lock = _get_cached_workflow()
+
+    if not run_lock.acquire(blocking=False):
+        logger.info("Cached workflow busy - running on a fresh instance")
+        return ProactiveWorkflow().run(destination_sink=destination_sink)
+
+    try:
+        return workflow.run(destination_sink=destination_sink)
+    finally:
+        run_lock.release()
@@ -135,6 +135,50 @@ class TestProactiveWorkflow:
         assert workflow._time_to is not None
         assert workflow._max_workers > 0
 
+    def test_s3_service_reports_uploaded_in_one_bulk_call(self, workflow):
+        """Test successful services' reports go to S3 in a single bulk upload."""
+        from src.workflows.proactive_workflow import ServiceResult
+
+        results = [
+            ServiceResult("svc-a", True, "high", "INC1", None, None, 1.0, ["Coding"]),
+            ServiceResult("svc-b", False, "unknown", None, None, "boom", 1.0, []),
+            ServiceResult("svc-c", True, "low", None, None, None, 1.0, []),
+        ]
+        workflow._s3_agent.upload_summary.return_value = {"success": True}
+        workflow._s3_agent.upload_reports_bulk.return_value = [{"success": True}] * 2
+
+        workflow._upload_summary(results=results, destination_sink="s3")
+
+        items = workflow._s3_agent.upload_reports_bulk.call_args.args[0]
+        assert [(name, timestamp) for name, _, timestamp in items] == [
+            ("svc-a", None),
+            ("svc-c", None),
+        ]
+        assert "INC1" in items[0][1]
+        workflow._s3_agent.upload_report.assert_not_called()
+
+    def test_cached_workflow_runs_twice(self, workflow):
+        """Test a warm workflow does not reuse the previous run's end time."""
+        import threading
+
+        from src.workflows.proactive_workflow import run_proactive_workflow
+
+        workflow._fetch_affected_services = Mock(
+            side_effect=[RuntimeError("DataDog unavailable"), ([], [])]
+        )
+
+        with patch(
+            "src.workflows.proactive_workflow._get_cached_workflow",
+            return_value=(workflow, threading.Lock()),
+        ):
+            first = run_proactive_workflow(destination_sink="s3")
+            second = run_proactive_workflow(destination_sink="s3")
+
+        assert first["success"] is False
+        assert second["success"] is True
+        assert workflow._end_time is None
+        assert second["execution_time_seconds"] >= 0
+
 
 class TestWorkflowIntegration:
     """Integration tests for complete workflows."""
@@ -5,16 +5,16 @@ Tests for BaseAgent and individual agent classes.
 """
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
 
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
-from src.agents.base import BaseAgent, AgentAction, AgentState
+from src.agents.base import BaseAgent, AgentAction, AgentState, clear_model_cache, _get_or_create_model
 from src.agents.datadog_agent import DataDogAgent
 from src.agents.coding_agent import CodingAgent
-from src.agents.servicenow_agent import ServiceNowAgent
+from src.agents.servicenow_agent import ServiceNowAgent, clear_servicenow_cache
 from src.agents.s3_agent import S3Agent
 from src.agents.orchestrator import OrchestratorAgent
 
@@ -45,6 +45,51 @@ class TestAgentAction:
         
         assert action.success is False
         assert action.error_message == "Something went wrong"
+    
+    def test_action_dict_round_trip(self):
+        """Test AgentAction serializes to and from a plain state dict."""
+        action = AgentAction(
+            action_type="test",
+            description="Round trip",
+            duration_ms=12,
+        )
+        
+        data = action.to_state_dict()
+        
+        assert data["action_type"] == "test"
+        assert data["duration_ms"] == 12
+        assert AgentAction.from_state_dict(data) == action
+    
+    def test_action_dict_has_iso_timestamp(self):
+        """Test exported action dicts carry ISO timestamps, not nanoseconds."""
+        action = AgentAction(
+            action_type="test",
+            description="Export",
+            timestamp=1_705_314_600_000_000_000,
+        )
+        
+        assert action.to_dict()["timestamp"] == "2024-01-15T10:30:00+00:00"
+        assert action.to_state_dict()["timestamp"] == 1_705_314_600_000_000_000
+    
+    def test_action_dict_copies_are_independent(self):
+        """Test the cached serialization is handed out as fresh copies."""
+        action = AgentAction(action_type="test", description="Cached")
+        
+        first = action.to_dict()
+        first["description"] = "Mutated"
+        
+        assert action.to_dict()["description"] == "Cached"
+        assert "_serialized" not in action.to_dict()
+    
+    def test_action_timestamp_iso(self):
+        """Test integer timestamps are formatted as ISO strings on demand."""
+        action = AgentAction(
+            action_type="test",
+            description="Timestamp",
+            timestamp=1_705_314_600_000_000_000,
+        )
+        
+        assert action.timestamp_iso == "2024-01-15T10:30:00+00:00"
 
 
 class TestAgentState:
@@ -61,6 +106,30 @@ class TestAgentState:
         assert state.agent_name == "test_agent"
         assert state.total_invocations == 0
         assert len(state.action_history) == 0
+    
+    @pytest.mark.parametrize(
+        "data",
+        [
+            "not-a-dict",
+            {"agent_name": "test_agent"},
+            {"agent_id": "a", "agent_name": "n", "total_invocations": "1"},
+            {"agent_id": "a", "agent_name": "n", "action_history": ["not-a-dict"]},
+            {
+                "agent_id": "a",
+                "agent_name": "n",
+                "action_history": [{"action_type": "t", "description": "d", "timestamp": "now"}],
+            },
+            {
+                "agent_id": "a",
+                "agent_name": "n",
+                "action_history": [{"action_type": "t", "description": "d", "extra": 1}],
+            },
+        ],
+    )
+    def test_invalid_state_dict_rejected(self, data):
+        """Test malformed state dicts raise ValueError instead of failing later."""
+        with pytest.raises(ValueError):
+            AgentState.from_state_dict(data)
 
 
 class TestBaseAgent:
@@ -109,6 +178,67 @@ class TestBaseAgent:
         
         assert mock_agent.state.failed_invocations == 1
     
+    def test_record_prebuilt_action(self, mock_agent):
+        """Test recording an already built AgentAction."""
+        action = AgentAction(action_type="test", description="Prebuilt", success=False)
+        
+        mock_agent.record_action(action)
+        
+        assert mock_agent.action_history[0] is action
+        assert mock_agent.state.failed_invocations == 1
+    
+    def test_action_history_is_bounded(self, mock_agent):
+        """Test action history keeps only the most recent actions."""
+        with patch("src.agents.base._ACTION_HISTORY_MAX", 2):
+            mock_agent.reset_state()
+        
+        for i in range(3):
+            mock_agent.record_action(action_type=f"action{i}", description="Action")
+        
+        assert [a.action_type for a in mock_agent.action_history] == ["action1", "action2"]
+        assert mock_agent.state.total_invocations == 3
+    
+    def test_lazy_summaries_skipped_without_history(self, mock_agent):
+        """Test callable summaries are only evaluated when history is kept."""
+        summary = Mock(return_value="expensive")
+        
+        mock_agent.record_action(action_type="kept", description="Action", output_summary=summary)
+        assert mock_agent.action_history[0].output_summary == "expensive"
+        
+        with patch("src.agents.base._ACTION_HISTORY_MAX", 0):
+            mock_agent.reset_state()
+        mock_agent.record_action(action_type="dropped", description="Action", output_summary=summary)
+        
+        assert summary.call_count == 1
+        assert len(mock_agent.action_history) == 0
+        assert mock_agent.state.total_invocations == 1
+    
+    async def test_ainvoke_invokes_directly_by_default(self, mock_agent):
+        """Test ainvoke awaits the final result without streaming."""
+        mock_agent._agent.invoke_async = AsyncMock(return_value="done")
+        
+        response = await mock_agent.ainvoke("hello")
+        
+        assert response == "done"
+        mock_agent._agent.stream_async.assert_not_called()
+    
+    async def test_ainvoke_streams_when_callback_given(self, mock_agent):
+        """Test a callback kwarg switches ainvoke to the event stream."""
+        async def events(message, **kwargs):
+            yield {"data": "hel"}
+            yield {"current_tool_use": {}}
+            yield {"data": "lo"}
+        
+        callback = Mock()
+        mock_agent._agent.stream_async = Mock(side_effect=events)
+        mock_agent._agent.invoke_async = AsyncMock()
+        
+        response = await mock_agent.ainvoke("hello", callback=callback)
+        
+        assert response == "hello"
+        mock_agent._agent.stream_async.assert_called_once_with("hello", callback=callback)
+        mock_agent._agent.invoke_async.assert_not_called()
+    
     def test_get_action_summary(self, mock_agent):
         """Test action summary generation."""
         mock_agent.record_action(
@@ -137,17 +267,64 @@ class TestBaseAgent:
         assert mock_agent.state.total_invocations == 0
 
 
+class TestModelCache:
+    """Tests for the process-global BedrockModel cache."""
+    
+    def test_model_reused_for_same_config(self):
+        """Test agents with the same model and region share one model."""
+        clear_model_cache()
+        with patch("src.agents.base.BedrockModel") as mock_model:
+            mock_model.side_effect = lambda **kwargs: Mock()
+            first = _get_or_create_model("model-a", "us-east-1")
+            second = _get_or_create_model("model-a", "us-east-1")
+            other = _get_or_create_model("model-a", "eu-west-1")
+        clear_model_cache()
+        
+        assert first is second
+        assert mock_model.call_count == 2
+        assert other is not first
+    
+    def test_cold_build_does_not_block_other_models(self):
+        """Test a slow model build does not hold up cache hits for other models."""
+        import threading
+        
+        clear_model_cache()
+        building = threading.Event()
+        release = threading.Event()
+        
+        def build(model_id, **kwargs):
+            if model_id == "model-slow":
+                building.set()
+                release.wait(timeout=5)
+            return Mock()
+        
+        with patch("src.agents.base.BedrockModel", side_effect=build):
+            warm = _get_or_create_model("model-a", "us-east-1")
+            worker = threading.Thread(
+                target=_get_or_create_model, args=("model-slow", "us-east-1")
+            )
+            worker.start()
+            assert building.wait(timeout=5)
+            
+            # Served from the cache while model-slow is still building
+            assert _get_or_create_model("model-a", "us-east-1") is warm
+            release.set()
+            worker.join(timeout=5)
+        clear_model_cache()
+
+
 class TestDataDogAgent:
     """Tests for DataDogAgent."""
     
     @pytest.fixture
     def agent(self):
         """Create a DataDog agent with mocked dependencies."""
+        # The client is built lazily, so keep it patched for the whole test
         with patch("src.agents.datadog_agent.DataDogClient"):
             with patch("src.agents.base.Agent"):
                 with patch("src.agents.base.BedrockModel"):
                     agent = DataDogAgent()
-        return agent
+            yield agent
     
     def test_agent_has_correct_type(self, agent):
         """Test agent has correct type."""
@@ -158,6 +335,30 @@ class TestDataDogAgent:
         tools = agent.get_tools()
         assert isinstance(tools, list)
         assert len(tools) == 3  # query_logs, extract_unique_services, format_logs_for_analysis
+    
+    def test_client_built_on_first_use(self, agent):
+        """Test the DataDog client is only created when first needed."""
+        assert agent._client is None
+        
+        client = agent._datadog_client
+        
+        assert agent._datadog_client is client
+    
+    def test_daily_error_summary_counts_by_service(self, agent):
+        """Test daily summary counts errors and warnings per service."""
+        agent._datadog_client.query_logs.return_value = [
+            {"attributes": {"service": "payment", "status": "error"}},
+            {"attributes": {"service": "payment", "status": "warn"}},
+            {"attributes": {"service": "auth", "status": "error"}},
+            {"attributes": {"status": "error"}},
+        ]
+        
+        summary = agent.get_daily_error_summary()
+        
+        assert summary["total_logs"] == 4
+        assert summary["services_affected"] == ["auth", "payment"]
+        assert summary["by_service"]["payment"] == {"total": 2, "errors": 1, "warnings": 1}
+        assert summary["by_service"]["auth"] == {"total": 1, "errors": 1, "warnings": 0}
 
 
 class TestCodingAgent:
@@ -193,6 +394,11 @@ class TestCodingAgent:
         assert "patterns" in result
         assert "severity" in result
         assert "suggestions" in result
+        assert [a.action_type for a in agent.action_history] == [
+            "analyze_patterns",
+            "suggest_fixes",
+            "full_analysis",
+        ]
 
 
 class TestServiceNowAgent:
@@ -217,6 +423,90 @@ class TestServiceNowAgent:
         assert isinstance(tools, list)
         assert len(tools) == 3  # create_incident, update_incident, get_incident_status
 
+    def test_search_incidents_bulk_buckets_by_service(self, agent):
+        """Test one bulk search is split per service and capped per service."""
+        agent._servicenow_client.search_incidents.return_value = [
+            {"number": "INC1", "category": "svc-a"},
+            {"number": "INC3", "category": "svc-b"},
+        ]
+
+        results = agent.search_incidents_bulk("errors", ["svc-a", "svc-b"], limit_per_service=1)
+
+        assert [t["number"] for t in results["svc-a"]] == ["INC1"]
+        assert [t["number"] for t in results["svc-b"]] == ["INC3"]
+        call = agent._servicenow_client.search_incidents.call_args
+        assert "categoryINsvc-a,svc-b" in call.kwargs["raw_query"]
+        assert call.kwargs["limit"] == 2
+        assert agent._servicenow_client.search_incidents.call_count == 1
+
+    def test_search_incidents_bulk_busy_service_does_not_starve_others(self, agent):
+        """Test services crowded out of a full page are searched again."""
+        agent._servicenow_client.search_incidents.side_effect = [
+            [
+                {"number": "INC1", "category": "svc-a"},
+                {"number": "INC2", "category": "svc-a"},
+            ],
+            [{"number": "INC3", "category": "svc-b"}],
+        ]
+
+        results = agent.search_incidents_bulk("errors", ["svc-a", "svc-b"], limit_per_service=1)
+
+        assert [t["number"] for t in results["svc-a"]] == ["INC1"]
+        assert [t["number"] for t in results["svc-b"]] == ["INC3"]
+        call = agent._servicenow_client.search_incidents.call_args
+        assert "categoryINsvc-b" in call.kwargs["raw_query"]
+        assert "svc-a" not in call.kwargs["raw_query"]
+        assert call.kwargs["limit"] == 1
+
+    def test_search_incidents_reuses_cached_results(self, agent):
+        """Test repeated searches hit the cache until a ticket is created."""
+        clear_servicenow_cache()
+        agent._servicenow_client.search_incidents.return_value = [{"number": "INC1"}]
+        agent._servicenow_client.create_incident.return_value = {"number": "INC2"}
+
+        first = agent.search_incidents("timeout", service_name="svc-a", mode="knowledge")
+        second = agent.search_incidents("timeout", service_name="svc-a", mode="knowledge")
+        agent.create_ticket(title="svc-a timeout", description="details")
+        agent.search_incidents("timeout", service_name="svc-a", mode="knowledge")
+        clear_servicenow_cache()
+
+        assert first == second
+        assert first is not second
+        assert agent._servicenow_client.search_incidents.call_count == 2
+        assert "(cached)" in agent.action_history[1].output_summary
+
+    def test_decision_searches_are_not_cached(self, agent):
+        """Test duplicate checks always query ServiceNow for active tickets."""
+        clear_servicenow_cache()
+        agent._servicenow_client.search_incidents.return_value = [{"number": "INC1"}]
+
+        agent.search_incidents("timeout", service_name="svc-a", mode="decision")
+        agent.search_incidents("timeout", service_name="svc-a", mode="decision")
+        clear_servicenow_cache()
+
+        assert agent._servicenow_client.search_incidents.call_count == 2
+
+    def test_batched_reads_resolve_on_flush(self, agent):
+        """Test batch=True reads are sent together and resolved by flush_batch."""
+        clear_servicenow_cache()
+        agent._servicenow_client.batch.return_value = [
+            {"result": [{"number": "INC1"}]},
+            {"result": {"sys_id": "abc", "number": "INC2", "state": "2"}},
+        ]
+        agent._servicenow_client.shape_search_results.side_effect = lambda results: results
+
+        search = agent.search_incidents("timeout", service_name="svc-a", batch=True)
+        status = agent.get_ticket_status("abc", batch=True)
+
+        assert not search.done()
+        assert agent.flush_batch() == 2
+        clear_servicenow_cache()
+
+        assert [t["number"] for t in search.result()] == ["INC1"]
+        assert status.result()["number"] == "INC2"
+        assert agent._servicenow_client.batch.call_count == 1
+        agent._servicenow_client.search_incidents.assert_not_called()
+
 
 class TestOrchestratorAgent:
     """Tests for OrchestratorAgent."""
@@ -239,6 +529,81 @@ class TestOrchestratorAgent:
         assert agent._coding_agent is None
         assert agent._servicenow_agent is None
     
+    def test_specialist_built_once_under_concurrent_access(self, agent):
+        """Test concurrent first access builds a specialist only once."""
+        import threading
+        import time
+
+        def slow_build():
+            time.sleep(0.05)
+            return Mock()
+
+        with patch("src.agents.servicenow_agent.ServiceNowAgent", side_effect=slow_build) as mock_cls:
+            threads = [threading.Thread(target=lambda: agent.servicenow_agent) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert mock_cls.call_count == 1
+
+    def test_session_manager_built_on_first_invocation(self):
+        """Test the session manager is deferred until the agent is invoked."""
+        with patch("src.agents.base.Agent") as mock_agent_cls:
+            with patch("src.agents.base.BedrockModel"):
+                with patch(
+                    "src.agents.orchestrator.create_agentcore_session_manager"
+                ) as mock_create:
+                    OrchestratorAgent(session_id="session-1")
+
+                    assert mock_create.call_count == 0
+
+                    proxy = mock_agent_cls.call_args.kwargs["session_manager"]
+                    event = Mock()
+                    proxy._attach(event)
+                    proxy._attach(event)
+
+        mock_create.assert_called_once_with(
+            session_id="session-1", actor_id="session-1", region=None
+        )
+        manager = mock_create.return_value
+        manager.register_hooks.assert_called_once_with(event.agent.hooks)
+        manager.initialize.assert_called_once_with(event.agent)
+        assert proxy.manager is manager
+
+    def test_session_manager_delegates_after_attaching(self):
+        """Test SessionManager calls on the proxy attach the real manager first."""
+        from src.memory import LazySessionManager
+
+        manager = Mock()
+        proxy = LazySessionManager(lambda: manager)
+        agent = Mock()
+        message = {"role": "user", "content": [{"text": "hi"}]}
+
+        proxy.append_message(message, agent)
+        proxy.sync_agent(agent)
+        proxy.redact_latest_message(message, agent)
+
+        manager.register_hooks.assert_called_once_with(agent.hooks)
+        manager.initialize.assert_called_once_with(agent)
+        manager.append_message.assert_called_once_with(message, agent)
+        manager.sync_agent.assert_called_once_with(agent)
+        manager.redact_latest_message.assert_called_once_with(message, agent)
+        assert proxy.session_id is manager.session_id
+
+    def test_persist_session_attaches_memory(self):
+        """Test persist_session writes the conversation without an invocation."""
+        with patch("src.agents.base.Agent") as mock_agent_cls:
+            with patch("src.agents.base.BedrockModel"):
+                with patch(
+                    "src.agents.orchestrator.create_agentcore_session_manager"
+                ) as mock_create:
+                    agent = OrchestratorAgent(session_id="session-1")
+                    agent.persist_session()
+
+        manager = mock_create.return_value
+        manager.initialize.assert_called_once_with(mock_agent_cls.return_value)
+
     def test_generate_report(self, agent):
         """Test report generation."""
         agent.record_action(
@@ -251,6 +616,177 @@ class TestOrchestratorAgent:
         assert "Activity Report" in report
         assert "Orchestrator" in report
 
+    def test_iter_report_matches_generate_report(self, agent):
+        """Test the streamed report joins to the full report."""
+        agent._agent_reports.append(
+            {"agent": "DataDog Agent", "action": "Fetched logs", "result": "3 logs"}
+        )
+
+        chunks = list(agent.iter_report())
+
+        assert len(chunks) == 3
+        assert "".join(chunks) == agent.generate_report()
+
+    def test_analyze_and_report_kb_check_keeps_service_order(self, agent):
+        """Test the bulk KB check results are recorded in service order."""
+        agent._datadog_agent = Mock()
+        agent._datadog_agent.fetch_logs.return_value = [{"attributes": {}}]
+        agent._datadog_agent.group_logs_by_service.return_value = {
+            "svc-a": [{"attributes": {"service": "svc-a"}}],
+            "svc-b": [{"attributes": {"service": "svc-b"}}],
+            "svc-c": [{"attributes": {"service": "svc-c"}}],
+        }
+        agent._servicenow_agent = Mock()
+        agent._servicenow_agent.search_incidents_bulk.side_effect = (
+            lambda service_names, **kwargs: {s: [{"number": f"INC-{s}"}] for s in service_names}
+        )
+
+        result = agent.analyze_and_report("errors")
+
+        assert [t["service"] for t in result["tickets_created"]] == ["svc-a", "svc-b", "svc-c"]
+        assert result["tickets_created"][1]["ticket_number"] == ["INC-svc-b"]
+
+    def test_analyze_and_report_analyzes_services_without_kb_match(self, agent):
+        """Test only services with no resolved KB tickets are analyzed."""
+        agent._datadog_agent = Mock()
+        agent._datadog_agent.fetch_logs.return_value = [{"attributes": {}}]
+        agent._datadog_agent.group_logs_by_service.return_value = {
+            "svc-a": [{"attributes": {"service": "svc-a"}}],
+            "svc-b": [{"attributes": {"service": "svc-b"}}],
+        }
+        agent._servicenow_agent = Mock()
+        agent._servicenow_agent.search_incidents_bulk.return_value = {"svc-a": [{"number": "INC1"}]}
+        agent._coding_agent = Mock()
+        agent._coding_agent.full_analysis.return_value = {
+            "severity": {"severity": "low"},
+            "patterns": {"error_types": []},
+        }
+
+        result = agent.analyze_and_report("errors", create_tickets=False)
+
+        assert list(result["stages"]["analysis"]) == ["svc-b"]
+        agent._coding_agent.full_analysis.assert_called_once()
+        agent._datadog_agent.format_logs.assert_called_once_with([{"attributes": {"service": "svc-b"}}])
+
+    def test_analyze_and_report_creates_tickets_in_service_order(self, agent):
+        """Test concurrent ticket handling skips low severity and keeps order."""
+        agent._datadog_agent = Mock()
+        agent._datadog_agent.fetch_logs.return_value = [{"attributes": {}}]
+        agent._datadog_agent.group_logs_by_service.return_value = {
+            "svc-a": [{"attributes": {"service": "svc-a"}}],
+            "svc-b": [{"attributes": {"service": "svc-b"}}],
+            "svc-c": [{"attributes": {"service": "svc-c"}}],
+        }
+        agent._servicenow_agent = Mock()
+        agent._servicenow_agent.search_incidents_bulk.return_value = {}
+        agent._servicenow_agent.search_incidents.side_effect = (
+            lambda service_name, **kwargs: [{"number": "INC-dup"}] if service_name == "svc-a" else []
+        )
+        agent._servicenow_agent.create_ticket_from_analysis.side_effect = (
+            lambda service_name, **kwargs: {"number": f"INC-{service_name}"}
+        )
+        severities = {"svc-a": "high", "svc-b": "low", "svc-c": "critical"}
+        agent._coding_agent = Mock()
+        agent._coding_agent.full_analysis.side_effect = lambda logs, service_name: {
+            "severity": {"severity": severities[service_name]},
+            "patterns": {"error_types": []},
+        }
+
+        result = agent.analyze_and_report("errors")
+
+        tickets = result["tickets_created"]
+        assert [t["service"] for t in tickets] == ["svc-a", "svc-c"]
+        assert tickets[0]["ticket_number"] == ["INC-dup"]
+        assert tickets[1]["ticket_number"] == "INC-svc-c"
+        assert agent._datadog_agent.format_logs.call_count == 3  # once per analyzed service
+
+    async def test_aanalyze_and_report_matches_sync_result(self, agent):
+        """Test the async workflow entry point returns the workflow result."""
+        agent._datadog_agent = Mock()
+        agent._datadog_agent.fetch_logs.return_value = []
+        agent._datadog_agent.group_logs_by_service.return_value = {}
+
+        result = await agent.aanalyze_and_report("errors", time_from="now-1h")
+
+        assert result["time_range"] == {"from": "now-1h", "to": "now"}
+        assert result["summary"] == "No error/warning logs found in the specified time range."
+
+    def test_get_all_agent_actions_merged_by_timestamp(self, agent):
+        """Test actions from all agents are interleaved in timestamp order."""
+        agent.record_action(AgentAction(timestamp=1, action_type="o1", description=""))
+        agent.record_action(AgentAction(timestamp=3, action_type="o2", description=""))
+        agent._datadog_agent = Mock()
+        agent._datadog_agent.action_history = [
+            AgentAction(timestamp=2, action_type="d1", description=""),
+            AgentAction(timestamp=4, action_type="d2", description=""),
+        ]
+
+        actions = agent.get_all_agent_actions()
+
+        assert [a["action_type"] for a in actions] == ["o1", "d1", "o2", "d2"]
+        assert actions[1]["agent"] == "DataDog"
+        assert next(agent.iter_all_agent_actions())["action_type"] == "o1"
+
+    def test_iter_all_agent_actions_snapshots_histories(self, agent):
+        """Test out-of-order appends are merged in order and later ones are excluded."""
+        agent.record_action(AgentAction(timestamp=3, action_type="o2", description=""))
+        agent.record_action(AgentAction(timestamp=1, action_type="o1", description=""))
+
+        actions = agent.iter_all_agent_actions()
+        agent.record_action(AgentAction(timestamp=2, action_type="late", description=""))
+
+        assert [a["action_type"] for a in actions] == ["o1", "o2"]
+
+    def test_reset_all_agents_clears_reports_in_place(self, agent):
+        """Test resetting keeps the same bounded report buffer."""
+        reports = agent._agent_reports
+        reports.append({"agent": "Test", "action": "a", "result": "r"})
+
+        agent.reset_all_agents()
+
+        assert agent._agent_reports is reports
+        assert len(reports) == 0
+        assert reports.maxlen is not None
+
+    def test_state_blob_round_trip(self, agent):
+        """Test orchestrator state survives a payload state blob."""
+        from src.memory import encode_state_blob, decode_state_blob
+
+        agent.record_action(action_type="test", description="Test action")
+        messages = [{"role": "user", "content": [{"text": "hello"}]}]
+
+        seed = decode_state_blob(encode_state_blob(messages, agent.state.to_state_dict()))
+        agent.reset_state()
+        agent.restore_state(AgentState.from_state_dict(seed["state"]))
+
+        assert seed["messages"] == messages
+        assert agent.state.agent_id == agent.agent_id
+        assert agent.state.action_history[0].description == "Test action"
+
+    def test_invalid_state_blob_rejected(self):
+        """Test malformed state blobs raise ValueError."""
+        from src.memory import decode_state_blob
+
+        with pytest.raises(ValueError):
+            decode_state_blob("not-a-blob")
+
+
+    def test_oversized_state_blob_rejected(self):
+        """Test blobs over the payload limit or inflating past the cap are rejected."""
+        import base64
+        import gzip
+
+        from src.memory import STATE_PAYLOAD_LIMIT, decode_state_blob
+        from src.memory.payload_state import _STATE_DECODED_MAX
+
+        with pytest.raises(ValueError, match="limit"):
+            decode_state_blob("A" * (STATE_PAYLOAD_LIMIT + 4))
+
+        bomb = base64.b64encode(gzip.compress(b" " * (_STATE_DECODED_MAX + 1))).decode("ascii")
+        assert len(bomb) <= STATE_PAYLOAD_LIMIT
+        with pytest.raises(ValueError, match="decompresses"):
+            decode_state_blob(bomb)
+
 
 class TestS3Agent:
     """Tests for S3Agent."""
@@ -273,6 +809,18 @@ class TestS3Agent:
         tools = agent.get_tools()
         assert isinstance(tools, list)
         assert len(tools) == 2  # upload_service_report, upload_summary_report
+    
+    def test_upload_reports_bulk_preserves_order(self, agent):
+        """Test bulk uploads return results in item order and record one action."""
+        agent._s3_client.upload_report.side_effect = (
+            lambda service, content, timestamp: {"success": True, "s3_uri": f"s3://b/{service}"}
+        )
+        
+        results = agent.upload_reports_bulk([("svc-a", "# A", None), ("svc-b", "# B", "t1")])
+        
+        assert [r["s3_uri"] for r in results] == ["s3://b/svc-a", "s3://b/svc-b"]
+        assert len(agent.action_history) == 1
+        assert agent.action_history[0].success is True
 
 
 class TestStandaloneUsage:
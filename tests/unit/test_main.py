@@ -0,0 +1,219 @@
+"""
+Unit Tests for Main Entry Point
+
+Tests for the warm agent pool used by chat and swarm invocations.
+"""
+
+import threading
+import time
+
+import pytest
+from unittest.mock import Mock, patch
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from src import main
+
+
+class TestAgentPool:
+    """Tests for the warm agent pool."""
+
+    @pytest.fixture(autouse=True)
+    def empty_pool(self):
+        """Start and finish every test with an empty pool."""
+        main._agent_pool.clear()
+        main._agent_pool_build_locks.clear()
+        yield
+        main._agent_pool.clear()
+        main._agent_pool_build_locks.clear()
+
+    def test_instance_reused_across_checkouts(self):
+        """Test sequential checkouts of a key share one built instance."""
+        factory = Mock(side_effect=object)
+
+        with main._checkout_pooled(("swarm",), factory) as first:
+            pass
+        with main._checkout_pooled(("swarm",), factory) as second:
+            pass
+
+        assert first is second
+        assert factory.call_count == 1
+
+    def test_idle_instance_evicted(self):
+        """Test an instance idle past the timeout is rebuilt."""
+        factory = Mock(side_effect=object)
+
+        with main._checkout_pooled(("swarm",), factory) as first:
+            pass
+        with patch.object(main, "_AGENT_POOL_IDLE_S", -1):
+            with main._checkout_pooled(("swarm",), factory) as second:
+                pass
+
+        assert first is not second
+        assert factory.call_count == 2
+
+    def test_least_recently_used_evicted_past_max(self):
+        """Test the pool drops its least recently used entry when full."""
+        with patch.object(main, "_AGENT_POOL_MAX", 2):
+            for key in ("a", "b", "c"):
+                with main._checkout_pooled((key,), object):
+                    pass
+
+        assert list(main._agent_pool) == [("b",), ("c",)]
+
+    def test_busy_instance_not_shared(self):
+        """Test a checkout while the pooled instance is busy gets a fresh one."""
+        factory = Mock(side_effect=object)
+
+        with main._checkout_pooled(("swarm",), factory) as pooled:
+            with main._checkout_pooled(("swarm",), factory) as fresh:
+                assert fresh is not pooled
+
+        # The fresh instance is not pooled; the pooled one is free again
+        with main._checkout_pooled(("swarm",), factory) as again:
+            assert again is pooled
+        assert len(main._agent_pool) == 1
+
+    def test_busy_session_waits_for_pooled_instance(self):
+        """Test a persistent checkout waits for the pooled instance to be released."""
+        factory = Mock(side_effect=object)
+        holding = threading.Event()
+
+        def hold_checkout():
+            with main._checkout_pooled(("orchestrator",), factory, persistent=True):
+                holding.set()
+                time.sleep(0.1)
+
+        worker = threading.Thread(target=hold_checkout)
+        worker.start()
+        assert holding.wait(timeout=5)
+
+        with main._checkout_pooled(("orchestrator",), factory, wait_s=5, persistent=True):
+            pass
+        worker.join(timeout=5)
+
+        assert factory.call_count == 1
+
+    def test_fallback_turn_evicts_stale_session(self):
+        """Test a fallback turn on a busy session evicts the now stale pooled instance."""
+        factory = Mock(side_effect=object)
+
+        with main._checkout_pooled(("orchestrator",), factory, persistent=True) as pooled:
+            with main._checkout_pooled(("orchestrator",), factory, persistent=True) as fresh:
+                assert fresh is not pooled
+            assert ("orchestrator",) not in main._agent_pool
+
+        with main._checkout_pooled(("orchestrator",), factory, persistent=True) as rebuilt:
+            assert rebuilt is not pooled
+        assert factory.call_count == 3
+
+    def test_concurrent_checkouts_get_distinct_instances(self):
+        """Test invocations on other threads never share an instance."""
+        holding = threading.Event()
+        release = threading.Event()
+        seen = []
+
+        def hold_checkout():
+            with main._checkout_pooled(("swarm",), object) as instance:
+                seen.append(instance)
+                holding.set()
+                release.wait(timeout=5)
+
+        worker = threading.Thread(target=hold_checkout)
+        worker.start()
+        assert holding.wait(timeout=5)
+
+        with main._checkout_pooled(("swarm",), object) as instance:
+            seen.append(instance)
+
+        release.set()
+        worker.join(timeout=5)
+
+        assert seen[0] is not seen[1]
+
+    def test_failed_invocation_releases_instance(self):
+        """Test an exception inside the checkout frees the pooled instance."""
+        factory = Mock(side_effect=object)
+
+        with pytest.raises(RuntimeError):
+            with main._checkout_pooled(("swarm",), factory):
+                raise RuntimeError("invoke failed")
+
+        with main._checkout_pooled(("swarm",), factory):
+            pass
+
+        assert factory.call_count == 1
+
+    def test_handle_swarm_resets_checked_out_swarm(self):
+        """Test handle_swarm resets and runs the swarm it checked out."""
+        swarm = Mock()
+        swarm.run.return_value.to_dict.return_value = {"success": True}
+
+        with patch("src.workflows.AIOpsSwarm", return_value=swarm):
+            result = main.handle_swarm({"task": "Check error rates"})
+
+        assert result == {"success": True}
+        swarm.reset.assert_called_once()
+        swarm.run.assert_called_once_with("Check error rates")
+
+    def test_spill_seeds_new_memory_session(self):
+        """Test a spilled payload session is seeded into a fresh pooled session."""
+        source = Mock()
+        source.inner_agent.messages = [{"role": "user", "content": [{"text": "hi"}]}]
+
+        with patch("src.memory.encode_state_blob", return_value=None):
+            with patch("src.agents.OrchestratorAgent") as mock_orchestrator:
+                result = main._export_payload_state(source, "session-1")
+
+        assert result["state_spilled"] is True
+        assert result["session_id"] != "session-1"
+        kwargs = mock_orchestrator.call_args.kwargs
+        assert kwargs["session_id"] == result["session_id"]
+        assert kwargs["messages"] == source.inner_agent.messages
+        pooled = mock_orchestrator.return_value
+        pooled.restore_state.assert_called_once_with(source.state)
+        pooled.persist_session.assert_called_once()
+
+
+class TestInvoke:
+    """Tests for invocation dispatch."""
+
+    def test_eventbridge_source_runs_proactive_workflow(self):
+        """Test scheduled EventBridge events run the proactive workflow."""
+        with patch.dict(main._MODE_HANDLERS, {"proactive": Mock(return_value={"ok": True})}):
+            result = main.invoke({"source": "aws.events", "mode": "chat"})
+
+        assert result == {"ok": True}
+
+    def test_unhashable_source_falls_back_to_mode(self):
+        """Test a non-string source is ignored instead of raising."""
+        chat = Mock(return_value={"ok": True})
+
+        with patch.dict(main._MODE_HANDLERS, {"chat": chat}):
+            result = main.invoke({"source": ["aws.events"], "mode": "chat"})
+
+        assert result == {"ok": True}
+        chat.assert_called_once()
+
+    def test_chat_rejects_malformed_state_blob(self):
+        """Test a state blob with an invalid state returns an error response."""
+        from src.memory import encode_state_blob
+
+        blob = encode_state_blob([], {"agent_id": "a", "agent_name": "n", "action_history": [1]})
+
+        result = main.handle_chat({"message": "hi", "session_id": "s-1", "state_blob": blob})
+
+        assert result["success"] is False
+        assert "Invalid state_blob" in result["error"]
+
+    def test_missing_field_errors_are_fresh_copies(self):
+        """Test annotating an error response does not change the shared template."""
+        first = main.handle_swarm({})
+        first["session_id"] = "s-1"
+
+        second = main.handle_swarm({})
+
+        assert second == {"success": False, "error": "Missing 'task' in payload"}
+        assert first is not second
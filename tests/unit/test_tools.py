@@ -11,10 +11,10 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
-from src.tools.datadog_tools import DataDogClient, query_logs, extract_unique_services, format_logs_for_analysis
+from src.tools.datadog_tools import DataDogClient, clear_query_cache, query_logs, extract_unique_services, format_logs_for_analysis
 from src.tools.servicenow_tools import ServiceNowClient, create_incident, update_incident, get_incident_status
 from src.tools.code_analysis_tools import CodeAnalyzer, analyze_error_patterns, suggest_code_fix, assess_severity
-from src.tools.s3_tools import S3Client, upload_service_report, upload_summary_report
+from src.tools.s3_tools import S3Client, clear_s3_client_cache, upload_service_report, upload_summary_report
 
 
 class TestDataDogClient:
@@ -23,6 +23,7 @@ class TestDataDogClient:
     @pytest.fixture
     def client(self):
         """Create a DataDog client with mock credentials."""
+        clear_query_cache()
         with patch.dict(os.environ, {
             "DATADOG_API_KEY": "test-api-key",
             "DATADOG_APP_KEY": "test-app-key",
@@ -60,6 +61,20 @@ class TestDataDogClient:
         assert len(logs) == 2
         mock_post.assert_called_once()
     
+    @patch("src.tools.datadog_tools.requests.post")
+    def test_query_logs_cached(self, mock_post, client):
+        """Test identical queries within the TTL hit the API once."""
+        mock_response = Mock()
+        mock_response.json.return_value = {"data": [{"attributes": {"service": "a"}}]}
+        mock_post.return_value = mock_response
+        
+        first = client.query_logs(time_from="now-1h", time_to="now")
+        second = client.query_logs(time_from="now-1h", time_to="now")
+        client.query_logs(time_from="now-2h", time_to="now")
+        
+        assert first == second
+        assert mock_post.call_count == 2
+    
     @patch("src.tools.datadog_tools.requests.post")
     def test_query_logs_timeout(self, mock_post, client):
         """Test log query handles timeout."""
@@ -83,6 +98,20 @@ class TestDataDogClient:
         
         assert services == {"service-a", "service-b"}
     
+    def test_group_by_service(self, client):
+        """Test logs are bucketed by service in their original order."""
+        logs = [
+            {"attributes": {"service": "service-a", "message": "1"}},
+            {"attributes": {"service": "service-b", "message": "2"}},
+            {"attributes": {"service": "service-a", "message": "3"}},
+            {"attributes": {}},  # No service
+        ]
+        
+        groups = client.group_by_service(logs)
+        
+        assert list(groups) == ["service-a", "service-b"]
+        assert groups["service-a"] == [logs[0], logs[2]]
+    
     def test_format_logs(self, client):
         """Test log formatting."""
         logs = [
@@ -126,8 +155,16 @@ class TestServiceNowClient:
     def test_base_url_property(self, client):
         """Test base URL is correctly formatted."""
         assert client.base_url == "https://test.service-now.com"
+
+    def test_clients_share_pooled_session(self, client):
+        """Test all clients reuse one HTTP session and keep no cookies."""
+        other = ServiceNowClient(instance="other.service-now.com")
+
+        assert other._session is client._session
+        assert client._session.adapters["https://"]._pool_maxsize == 50
+        assert client._session.cookies.get_policy().is_not_allowed("test.service-now.com")
     
-    @patch("src.tools.servicenow_tools.requests.post")
+    @patch("src.tools.servicenow_tools.requests.Session.post")
     def test_create_incident_success(self, mock_post, client):
         """Test successful incident creation."""
         mock_response = Mock()
@@ -158,6 +195,39 @@ class TestServiceNowClient:
         assert impact == "3"
         assert urgency == "3"
 
+    @patch("src.tools.servicenow_tools.requests.Session.post")
+    def test_batch_returns_responses_in_request_order(self, mock_post, client):
+        """Test batch sub-responses are decoded and matched to their requests."""
+        import base64
+        import json
+
+        def encode(body):
+            return base64.b64encode(json.dumps(body).encode()).decode()
+
+        mock_response = Mock()
+        mock_response.json.return_value = {
+            "serviced_requests": [
+                {
+                    "id": "1",
+                    "status_code": 404,
+                    "body": encode({"error": {"message": "No Record found"}}),
+                },
+                {"id": "0", "status_code": 200, "body": encode({"result": {"number": "INC1"}})},
+            ]
+        }
+        mock_response.raise_for_status = Mock()
+        mock_post.return_value = mock_response
+
+        results = client.batch([
+            {"method": "GET", "url": client.incident_path("abc")},
+            {"method": "GET", "url": client.incident_path("missing")},
+        ])
+
+        assert results[0] == {"result": {"number": "INC1"}}
+        assert "No Record found" in results[1]["error"]
+        assert mock_post.call_count == 1
+        assert mock_post.call_args.args[0] == "https://test.service-now.com/api/now/v1/batch"
+
 
 class TestCodeAnalyzer:
     """Tests for CodeAnalyzer."""
@@ -181,6 +251,28 @@ class TestCodeAnalyzer:
         assert "ConnectionRefused" in patterns["error_types"]
         assert "Timeout" in patterns["error_types"]
     
+    def test_analyze_patterns_counts_each_type_once_per_line(self, analyzer):
+        """Test several keywords of one error type count once per line."""
+        log_context = "\n".join(
+            ["[ERROR] [api] TimeoutException: request timed out, Unauthorized"] * 3
+        )
+        
+        patterns = analyzer.analyze_patterns(log_context)
+        
+        assert patterns["error_types"] == ["Timeout", "AuthenticationError"]
+        assert {"type": "Timeout", "count": 3} in patterns["recurring_issues"]
+    
+    def test_analyze_patterns_cached_results_are_independent(self, analyzer):
+        """Test repeated analysis of the same context returns fresh containers."""
+        log_context = "[2024-01-15T10:30:00] [ERROR] [payment-api] Timeout"
+        
+        first = analyzer.analyze_patterns(log_context)
+        first["error_types"].append("Mutated")
+        second = analyzer.analyze_patterns(log_context)
+        
+        assert second["error_types"] == ["Timeout"]
+        assert second["affected_services"] == ["payment-api"]
+    
     def test_analyze_patterns_extracts_services(self, analyzer):
         """Test pattern analysis extracts services."""
         log_context = """
@@ -229,6 +321,7 @@ class TestS3Client:
     @pytest.fixture
     def client(self):
         """Create an S3 client with mock credentials."""
+        clear_s3_client_cache()
         with patch.dict(os.environ, {
             "S3_REPORTS_BUCKET": "test-bucket",
             "AWS_DEFAULT_REGION": "us-east-1",
@@ -243,6 +336,7 @@ class TestS3Client:
     @patch("src.tools.s3_tools.boto3.client")
     def test_upload_report(self, mock_boto):
         """Test report upload."""
+        clear_s3_client_cache()
         with patch.dict(os.environ, {
             "S3_REPORTS_BUCKET": "test-bucket",
         }):
@@ -258,6 +352,29 @@ class TestS3Client:
             assert result["success"] is True
             assert "s3://" in result["s3_uri"]
             mock_s3.put_object.assert_called_once()
+    
+    @patch("src.tools.s3_tools.boto3.client")
+    def test_upload_report_bytes_passed_through(self, mock_boto):
+        """Test pre-encoded report content is uploaded without re-encoding."""
+        clear_s3_client_cache()
+        mock_s3 = Mock()
+        mock_boto.return_value = mock_s3
+        content = "# Report ✓".encode("utf-8")
+        
+        S3Client(bucket="test-bucket").upload_report("svc", content, "t1")
+        
+        assert mock_s3.put_object.call_args.kwargs["Body"] is content
+    
+    @patch("src.tools.s3_tools.boto3.client")
+    def test_boto3_client_shared_per_region(self, mock_boto):
+        """Test S3 clients in the same region reuse one boto3 client."""
+        clear_s3_client_cache()
+        
+        S3Client(bucket="a", region="us-east-1")
+        S3Client(bucket="b", region="us-east-1")
+        S3Client(bucket="c", region="eu-west-1")
+        
+        assert mock_boto.call_count == 2
 
 
 class TestToolFunctions: